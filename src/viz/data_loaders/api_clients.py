@@ -4,7 +4,11 @@ Generic API Client Utilities
 Provides reusable utilities for fetching data from various APIs.
 """
 
+import hashlib
+import re
 import requests
+from requests.adapters import HTTPAdapter
+import threading
 import time
 from typing import Dict, Any, Optional
 from pathlib import Path
@@ -20,23 +24,47 @@ class APIClient:
         base_url: str,
         rate_limit: float = 1.0,  # seconds between requests
         cache_dir: Optional[Path] = None,
+        burst: int = 1,  # requests allowed back-to-back before throttling
+        pool_size: int = 32,  # pooled keep-alive connections per host
     ):
         self.base_url = base_url
         self.rate_limit = rate_limit
-        self.last_request_time = 0
+        self.burst = max(1, burst)
+        # Token bucket state, refilled at 1/rate_limit tokens per second
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+        # Reuse TCP/TLS connections across requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.cache_dir = cache_dir or Path("data/cache")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
     
     def _rate_limit(self):
-        """Enforce rate limiting."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.rate_limit:
-            time.sleep(self.rate_limit - elapsed)
-        self.last_request_time = time.time()
+        """Enforce rate limiting with a thread-safe token bucket."""
+        if self.rate_limit <= 0:
+            return
+        
+        rate = 1.0 / self.rate_limit
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * rate)
+            self._last = now
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) / rate)
+                # The sleep earned exactly the missing fraction of a token
+                self._tokens = 1.0
+                self._last = time.monotonic()
+            self._tokens -= 1
     
     def _get_cache_path(self, endpoint: str, params: Dict[str, Any]) -> Path:
         """Generate cache file path from endpoint and params."""
-        cache_key = f"{endpoint}_{hash(str(sorted(params.items())))}"
+        # Flatten path separators and use a stable digest so keys survive restarts
+        safe_endpoint = re.sub(r"[^A-Za-z0-9_.-]+", "_", endpoint.strip("/"))
+        digest = hashlib.sha1(str(sorted(params.items())).encode()).hexdigest()[:16]
+        cache_key = f"{safe_endpoint}_{digest}"
         return self.cache_dir / f"{cache_key}.json"
     
     def get(
@@ -71,7 +99,7 @@ class APIClient:
         url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
         
         try:
-            response = requests.get(url, params=params, timeout=timeout)
+            response = self.session.get(url, params=params, timeout=timeout)
             response.raise_for_status()
             data = response.json()
             
@@ -7,6 +7,8 @@ Loads financial and market data from various sources:
 - Financial APIs
 """
 
+import functools
+import time
 import pandas as pd
 import yfinance as yf
 from pathlib import Path
@@ -15,6 +17,16 @@ from datetime import datetime, timedelta
 import json
 
 
+# Ticker.info is cached per symbol for one hour
+INFO_CACHE_TTL = 3600
+
+
+@functools.lru_cache(maxsize=512)
+def _fetch_info(symbol: str, bucket: int) -> Dict[str, Any]:
+    """Fetch Ticker.info; `bucket` changes every INFO_CACHE_TTL seconds to expire entries."""
+    return yf.Ticker(symbol).info
+
+
 class FinancialDataLoader:
     """Loader for financial and market data."""
     
@@ -87,6 +99,40 @@ class FinancialDataLoader:
         
         return data
     
+    def load_existing_market_data_concat(self, symbols: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load existing market data into a single long-format DataFrame.
+        
+        Args:
+            symbols: Optional list of symbols to load (default: all available)
+            
+        Returns:
+            DataFrame with all rows and a 'symbol' column identifying the source
+        """
+        synthetic_dir = self.data_dir / "synthetic"
+        
+        if not synthetic_dir.exists():
+            return pd.DataFrame()
+        
+        if symbols:
+            paths = [synthetic_dir / f"price_data_{s}.parquet" for s in symbols]
+            paths = [p for p in paths if p.exists()]
+        else:
+            paths = sorted(synthetic_dir.glob("price_data_*.parquet"))
+        
+        frames = []
+        for file_path in paths:
+            try:
+                symbol_name = file_path.stem.replace("price_data_", "")
+                frames.append(pd.read_parquet(file_path).assign(symbol=symbol_name))
+            except Exception as e:
+                print(f"Error loading {file_path}: {e}")
+        
+        if not frames:
+            return pd.DataFrame()
+        
+        return pd.concat(frames, ignore_index=True)
+    
     def get_stock_info(self, symbol: str) -> Dict[str, Any]:
         """
         Get stock information and metadata.
@@ -98,9 +144,9 @@ class FinancialDataLoader:
             Dictionary with stock info
         """
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            return info
+            info = _fetch_info(symbol, int(time.time() // INFO_CACHE_TTL))
+            # Copy so callers cannot mutate the cached response
+            return dict(info)
         except Exception as e:
             print(f"Error getting info for {symbol}: {e}")
             return {}
@@ -133,21 +179,24 @@ class FinancialDataLoader:
         Returns:
             Correlation matrix DataFrame
         """
-        # Align all dataframes by date
-        closes = {}
+        # Collect Close series indexed by date
+        closes = []
         for symbol, df in data.items():
+            if 'Close' not in df.columns:
+                continue
+            
             if 'Date' in df.columns:
-                df = df.set_index('Date')
+                close = df.set_index('Date')['Close']
             elif 'Datetime' in df.columns:
-                df = df.set_index('Datetime')
-            
-            if 'Close' in df.columns:
-                closes[symbol] = df['Close']
+                close = df.set_index('Datetime')['Close']
+            else:
+                close = df['Close']
+            closes.append(close.rename(symbol))
         
         if not closes:
             return pd.DataFrame()
         
-        # Combine and calculate correlation
-        combined = pd.DataFrame(closes)
+        # Align all series in a single outer join and calculate correlation
+        combined = pd.concat(closes, axis=1, join='outer')
         return combined.corr()
 
@@ -127,18 +127,15 @@ class HousingDataLoader:
         numerical_cols = self.get_numerical_features(df)
         numerical_cols = [col for col in numerical_cols if col != 'SalePrice' and col != 'Id']
         
-        # Calculate correlations
-        correlations = df[numerical_cols + ['SalePrice']].corr()['SalePrice'].drop('SalePrice')
-        correlations = correlations.sort_values(key=abs, ascending=False)
-        
-        # Create DataFrame
-        corr_df = pd.DataFrame({
-            'Feature': correlations.index,
-            'Correlation': correlations.values,
-            'Abs_Correlation': correlations.abs().values
-        }).sort_values('Abs_Correlation', ascending=False)
-        
-        return corr_df.head(top_n)
+        # Calculate correlations against SalePrice only, sorted once by magnitude
+        correlations = df[numerical_cols].corrwith(df['SalePrice'])
+        abs_correlations = correlations.abs().sort_values(ascending=False)[:top_n]
+        
+        return pd.DataFrame({
+            'Feature': abs_correlations.index,
+            'Correlation': correlations[abs_correlations.index].values,
+            'Abs_Correlation': abs_correlations.values,
+        })
     
     def get_neighborhood_stats(self, df: pd.DataFrame) -> pd.DataFrame:
         """
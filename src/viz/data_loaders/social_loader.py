@@ -8,22 +8,117 @@ Loads social and economic data from public sources:
 - Economic indicators
 """
 
+import functools
+import zlib
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from .api_clients import APIClient
 
 
+@functools.lru_cache(maxsize=1)
+def _get_worldbank_client() -> APIClient:
+    """Process-wide World Bank client so its connection pool is shared."""
+    return APIClient(
+        base_url="https://api.worldbank.org/v2",
+        rate_limit=1.0,
+    )
+
+
+# Sample data builders. Results are cached, so callers must copy before mutating.
+
+@functools.lru_cache(maxsize=32)
+def _sample_inequality_data(country: str) -> pd.DataFrame:
+    """Build sample inequality data for a country."""
+    # Sample data structure - in production would fetch from World Bank API
+    # World Bank API endpoint: /v2/country/{country}/indicator/SI.POV.GINI
+    
+    years = list(range(2000, 2023))
+    rng = np.random.default_rng(42)
+    
+    # Sample Gini coefficients (0-100 scale)
+    gini_values = rng.uniform(35, 45, len(years)) + np.linspace(0, 2, len(years))
+    
+    df = pd.DataFrame({
+        'Year': years,
+        'Country': country,
+        'Gini_Coefficient': gini_values,
+        'Income_Share_Top_10': 100 - gini_values * 0.8,  # Rough estimate
+        'Income_Share_Bottom_10': gini_values * 0.3,  # Rough estimate
+    })
+    
+    return df
+
+
+@functools.lru_cache(maxsize=32)
+def _sample_population_data(countries: Tuple[str, ...]) -> pd.DataFrame:
+    """Build sample population data for a tuple of country codes."""
+    # Sample population data structure
+    years = list(range(2000, 2023))
+    
+    # Sample population data (in millions)
+    population_data = {
+        'USA': [282, 285, 288, 291, 294, 297, 300, 303, 306, 309, 312, 315, 318, 321, 324, 327, 330, 333, 336, 339, 342, 345, 348],
+        'CHN': [1267, 1276, 1285, 1294, 1303, 1312, 1321, 1330, 1339, 1348, 1357, 1366, 1375, 1384, 1393, 1402, 1411, 1420, 1429, 1438, 1447, 1456, 1465],
+        'IND': [1053, 1071, 1089, 1107, 1125, 1143, 1161, 1179, 1197, 1215, 1233, 1251, 1269, 1287, 1305, 1323, 1341, 1359, 1377, 1395, 1413, 1431, 1449],
+    }
+    
+    pops = []
+    for country in countries:
+        if country in population_data:
+            pops.append(np.asarray(population_data[country]))
+        else:
+            # Generate sample data, seeded stably per country without touching global RNG state
+            rng = np.random.default_rng(zlib.crc32(country.encode()))
+            base_pop = rng.uniform(50, 500)
+            pops.append(base_pop * np.power(1.01, np.arange(len(years))))
+    
+    return pd.DataFrame({
+        'Year': np.tile(years, len(countries)),
+        'Country': np.repeat(countries, len(years)),
+        'Population_Millions': np.concatenate(pops) if pops else [],
+    })
+
+
+@functools.lru_cache(maxsize=1)
+def _sample_migration_data() -> pd.DataFrame:
+    """Build sample migration flow data."""
+    # Sample migration data
+    migration_flows = [
+        {
+            'Year': 2020,
+            'Origin': 'Mexico',
+            'Destination': 'USA',
+            'Migrants': 1200000,
+            'Origin_Lat': 23.6345,
+            'Origin_Lon': -102.5528,
+            'Dest_Lat': 39.8283,
+            'Dest_Lon': -98.5795,
+        },
+        {
+            'Year': 2020,
+            'Origin': 'Syria',
+            'Destination': 'Germany',
+            'Migrants': 800000,
+            'Origin_Lat': 34.8021,
+            'Origin_Lon': 38.9968,
+            'Dest_Lat': 51.1657,
+            'Dest_Lon': 10.4515,
+        },
+        # Add more migration flows
+    ]
+    
+    return pd.DataFrame(migration_flows)
+
+
 class SocialDataLoader:
     """Loader for social and economic data."""
     
     def __init__(self, data_dir: Optional[Path] = None):
         self.data_dir = data_dir or Path("data")
         # World Bank API
-        self.worldbank_client = APIClient(
-            base_url="https://api.worldbank.org/v2",
-            rate_limit=1.0,
-        )
+        self.worldbank_client = _get_worldbank_client()
     
     def load_economic_inequality_data(self, country: str = "USA") -> pd.DataFrame:
         """
@@ -35,32 +130,62 @@ class SocialDataLoader:
         Returns:
             DataFrame with inequality metrics
         """
-        # Sample data structure - in production would fetch from World Bank API
-        # World Bank API endpoint: /v2/country/{country}/indicator/SI.POV.GINI
+        # Sample data is deterministic, so it is built once per country
+        return _sample_inequality_data(country).copy()
+    
+    def fetch_worldbank_indicator(
+        self,
+        countries: List[str],
+        indicator: str,
+        start_year: int = 2000,
+        end_year: int = 2022,
+        use_cache: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Fetch a World Bank indicator for several countries in one request.
         
-        years = list(range(2000, 2023))
-        import numpy as np
-        np.random.seed(42)
+        Args:
+            countries: List of country codes (e.g., ['USA', 'CHN'])
+            indicator: World Bank indicator code (e.g., 'SP.POP.TOTL')
+            start_year: First year to fetch
+            end_year: Last year to fetch
+            use_cache: Whether to use cached responses
+            
+        Returns:
+            DataFrame with Year, Country and Value columns
+        """
+        # The API accepts semicolon-separated country codes in a single path
+        endpoint = f"country/{';'.join(countries)}/indicator/{indicator}"
+        params = {
+            'format': 'json',
+            'per_page': 20000,
+            'date': f"{start_year}:{end_year}",
+        }
+        response = self.worldbank_client.get(endpoint, params, use_cache=use_cache)
         
-        # Sample Gini coefficients (0-100 scale)
-        gini_values = np.random.uniform(35, 45, len(years)) + np.linspace(0, 2, len(years))
+        # Response is [paging metadata, records]
+        records = response[1] if isinstance(response, list) and len(response) > 1 else None
+        records = records or []
         
         df = pd.DataFrame({
-            'Year': years,
-            'Country': country,
-            'Gini_Coefficient': gini_values,
-            'Income_Share_Top_10': 100 - gini_values * 0.8,  # Rough estimate
-            'Income_Share_Bottom_10': gini_values * 0.3,  # Rough estimate
+            'Year': [int(r['date']) for r in records],
+            'Country': [r.get('countryiso3code') or r['country']['id'] for r in records],
+            'Value': [r['value'] for r in records],
         })
-        
-        return df
+        df = df.dropna(subset=['Value'])
+        return df.sort_values(['Country', 'Year']).reset_index(drop=True)
     
-    def load_population_data(self, countries: Optional[List[str]] = None) -> pd.DataFrame:
+    def load_population_data(
+        self,
+        countries: Optional[List[str]] = None,
+        use_api: bool = False,
+    ) -> pd.DataFrame:
         """
         Load population data for countries.
         
         Args:
             countries: List of country codes (default: major countries)
+            use_api: Fetch real data from the World Bank API instead of sample data
             
         Returns:
             DataFrame with population data
@@ -68,35 +193,12 @@ class SocialDataLoader:
         if countries is None:
             countries = ['USA', 'CHN', 'IND', 'JPN', 'DEU', 'GBR', 'FRA', 'BRA']
         
-        # Sample population data structure
-        years = list(range(2000, 2023))
-        
-        # Sample population data (in millions)
-        population_data = {
-            'USA': [282, 285, 288, 291, 294, 297, 300, 303, 306, 309, 312, 315, 318, 321, 324, 327, 330, 333, 336, 339, 342, 345, 348],
-            'CHN': [1267, 1276, 1285, 1294, 1303, 1312, 1321, 1330, 1339, 1348, 1357, 1366, 1375, 1384, 1393, 1402, 1411, 1420, 1429, 1438, 1447, 1456, 1465],
-            'IND': [1053, 1071, 1089, 1107, 1125, 1143, 1161, 1179, 1197, 1215, 1233, 1251, 1269, 1287, 1305, 1323, 1341, 1359, 1377, 1395, 1413, 1431, 1449],
-        }
+        if use_api:
+            df = self.fetch_worldbank_indicator(countries, 'SP.POP.TOTL')
+            df['Population_Millions'] = df.pop('Value') / 1e6
+            return df
         
-        data = []
-        for country in countries:
-            if country in population_data:
-                pops = population_data[country]
-            else:
-                # Generate sample data
-                import numpy as np
-                np.random.seed(hash(country) % 1000)
-                base_pop = np.random.uniform(50, 500)
-                pops = [base_pop * (1.01 ** (y - 2000)) for y in years]
-            
-            for year, pop in zip(years, pops):
-                data.append({
-                    'Year': year,
-                    'Country': country,
-                    'Population_Millions': pop,
-                })
-        
-        return pd.DataFrame(data)
+        return _sample_population_data(tuple(countries)).copy()
     
     def load_migration_data(self) -> pd.DataFrame:
         """
@@ -105,32 +207,7 @@ class SocialDataLoader:
         Returns:
             DataFrame with migration data
         """
-        # Sample migration data
-        migration_flows = [
-            {
-                'Year': 2020,
-                'Origin': 'Mexico',
-                'Destination': 'USA',
-                'Migrants': 1200000,
-                'Origin_Lat': 23.6345,
-                'Origin_Lon': -102.5528,
-                'Dest_Lat': 39.8283,
-                'Dest_Lon': -98.5795,
-            },
-            {
-                'Year': 2020,
-                'Origin': 'Syria',
-                'Destination': 'Germany',
-                'Migrants': 800000,
-                'Origin_Lat': 34.8021,
-                'Origin_Lon': 38.9968,
-                'Dest_Lat': 51.1657,
-                'Dest_Lon': 10.4515,
-            },
-            # Add more migration flows
-        ]
-        
-        return pd.DataFrame(migration_flows)
+        return _sample_migration_data().copy()
     
     def get_economic_indicators(self, country: str = "USA") -> Dict[str, Any]:
         """
@@ -4,6 +4,6 @@ Export Utilities
 This module contains exporters for various visualization formats:
 - static_exporter: Export PNG, SVG, PDF from matplotlib/seaborn
 - plotly_exporter: Export Plotly JSON for react-plotly.js
-- data_exporter: Export processed data as JSON/CSV for frontend
+- data_exporter: Export processed data as JSON/CSV/Parquet/Feather for frontend
 """
 
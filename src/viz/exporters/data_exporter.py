@@ -5,9 +5,79 @@ Exports processed data as JSON/CSV for frontend consumption.
 """
 
 import json
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Optional, Union, Dict, Any, List
+from typing import Optional, Union, Dict, Any, List, Iterable
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Write buffer size for exported files
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Rows serialised per batch by to_csv
+CSV_CHUNK_SIZE = 100_000
+
+# orjson flags shared by every JSON writer; datetimes are passed through to
+# _json_default so they are written exactly as the stdlib fallback writes them
+ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if ORJSON_AVAILABLE else 0
+)
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Encode values JSON has no type for, the same way on both backends.
+    
+    numpy arrays and scalars become lists and Python scalars as with
+    orjson's OPT_SERIALIZE_NUMPY: float32 values keep their shortest
+    repr and datetime64 values become ISO 8601 strings. Anything else,
+    such as datetimes and Timestamps, falls back to str().
+    """
+    if isinstance(obj, (np.ndarray, np.generic)):
+        if obj.dtype.kind == 'f' and obj.dtype.itemsize < 8:
+            obj = obj.astype(str).astype(np.float64)
+        elif obj.dtype.kind == 'M':
+            obj = obj.astype('datetime64[us]').astype(object)
+            if isinstance(obj, np.ndarray):
+                return np.vectorize(_isoformat, otypes=[object])(obj).tolist()
+            return _isoformat(obj)
+        return obj.tolist() if isinstance(obj, np.ndarray) else obj.item()
+    return str(obj)
+
+
+def _isoformat(value: Any) -> Optional[str]:
+    """ISO 8601 form of a datetime, or None for NaT."""
+    return None if value is None else value.isoformat()
+
+
+def _write_json(output_path: Path, data: Any, pretty: bool = False) -> None:
+    """
+    Write JSON-serialisable data to a file.
+    
+    Uses orjson when installed, which encodes numpy arrays/scalars natively;
+    the stdlib fallback encodes them through _json_default so both backends
+    write the same JSON.
+    """
+    if ORJSON_AVAILABLE:
+        option = ORJSON_OPTIONS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(data, default=_json_default, option=option))
+        return
+    
+    with open(output_path, 'w', buffering=WRITE_BUFFER_SIZE) as f:
+        if pretty:
+            json.dump(data, f, indent=2, default=_json_default)
+        else:
+            json.dump(data, f, separators=(',', ':'), default=_json_default)
 
 
 class DataExporter:
@@ -38,10 +108,8 @@ class DataExporter:
         """
         output_path = self.output_dir / f"{filename}.json"
         
-        json_str = df.to_json(orient=orient, date_format=date_format)
-        
-        with open(output_path, 'w') as f:
-            f.write(json_str)
+        with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            df.to_json(f, orient=orient, date_format=date_format)
         
         return output_path
     
@@ -64,7 +132,57 @@ class DataExporter:
         """
         output_path = self.output_dir / f"{filename}.csv"
         
-        df.to_csv(output_path, index=index)
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            df.to_csv(f, index=index, chunksize=CSV_CHUNK_SIZE)
+        
+        return output_path
+    
+    def export_dataframe_parquet(
+        self,
+        df: pd.DataFrame,
+        filename: str,
+        compression: str = "zstd",
+        index: bool = False,
+    ) -> Path:
+        """
+        Export DataFrame as Parquet using pyarrow.
+        
+        Args:
+            df: DataFrame to export
+            filename: Output filename (without extension)
+            compression: Compression codec (zstd, snappy, gzip, none)
+            index: Whether to include index
+            
+        Returns:
+            Path to saved Parquet file
+        """
+        output_path = self.output_dir / f"{filename}.parquet"
+        
+        df.to_parquet(output_path, engine="pyarrow", compression=compression, index=index)
+        
+        return output_path
+    
+    def export_dataframe_feather(
+        self,
+        df: pd.DataFrame,
+        filename: str,
+        compression: str = "zstd",
+    ) -> Path:
+        """
+        Export DataFrame as Feather (Arrow IPC) for apache-arrow consumers.
+        
+        Args:
+            df: DataFrame to export
+            filename: Output filename (without extension)
+            compression: Compression codec (zstd, lz4, uncompressed)
+            
+        Returns:
+            Path to saved Feather file
+        """
+        output_path = self.output_dir / f"{filename}.feather"
+        
+        # Feather requires a default RangeIndex
+        df.reset_index(drop=True).to_feather(output_path, compression=compression)
         
         return output_path
     
@@ -72,6 +190,7 @@ class DataExporter:
         self,
         data: Dict[str, Any],
         filename: str,
+        pretty: bool = False,
     ) -> Path:
         """
         Export dictionary as JSON.
@@ -79,14 +198,14 @@ class DataExporter:
         Args:
             data: Dictionary to export
             filename: Output filename (without extension)
+            pretty: Indent output for human reading (default: compact)
             
         Returns:
             Path to saved JSON file
         """
         output_path = self.output_dir / f"{filename}.json"
         
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        _write_json(output_path, data, pretty)
         
         return output_path
     
@@ -94,6 +213,7 @@ class DataExporter:
         self,
         data: List[Any],
         filename: str,
+        pretty: bool = False,
     ) -> Path:
         """
         Export list as JSON.
@@ -101,14 +221,45 @@ class DataExporter:
         Args:
             data: List to export
             filename: Output filename (without extension)
+            pretty: Indent output for human reading (default: compact)
             
         Returns:
             Path to saved JSON file
         """
         output_path = self.output_dir / f"{filename}.json"
         
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        _write_json(output_path, data, pretty)
+        
+        return output_path
+    
+    def export_list_ndjson(
+        self,
+        data: Iterable[Any],
+        filename: str,
+    ) -> Path:
+        """
+        Export records as newline-delimited JSON, one record per line.
+        
+        Records are encoded one at a time, so memory use does not grow with
+        the number of records and the frontend can parse the file as a stream.
+        
+        Args:
+            data: Iterable of JSON-serialisable records
+            filename: Output filename (without extension)
+            
+        Returns:
+            Path to saved NDJSON file
+        """
+        output_path = self.output_dir / f"{filename}.ndjson"
+        
+        with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            if ORJSON_AVAILABLE:
+                option = ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+                for item in data:
+                    f.write(orjson.dumps(item, default=_json_default, option=option))
+            else:
+                for item in data:
+                    line = json.dumps(item, separators=(',', ':'), default=_json_default)
+                    f.write(line.encode('utf-8') + b'\n')
         
         return output_path
-
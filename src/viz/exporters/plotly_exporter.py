@@ -4,11 +4,22 @@ Plotly JSON Exporter
 Exports Plotly figures as JSON for use with react-plotly.js.
 """
 
-import json
+import importlib.metadata
+import importlib.util
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
+from .data_exporter import WRITE_BUFFER_SIZE, _write_json
+
+
+def _kaleido_major_version() -> int:
+    """Major version of the installed Kaleido package (0 if unknown)."""
+    try:
+        return int(importlib.metadata.version("kaleido").split(".")[0])
+    except (importlib.metadata.PackageNotFoundError, ValueError):
+        return 0
 
 
 class PlotlyExporter:
@@ -23,6 +34,7 @@ class PlotlyExporter:
         fig: go.Figure,
         filename: str,
         include_data: bool = True,
+        pretty: bool = False,
     ) -> Path:
         """
         Export a Plotly figure as JSON.
@@ -31,26 +43,29 @@ class PlotlyExporter:
             fig: Plotly figure object
             filename: Output filename (without extension)
             include_data: Whether to include full data in JSON
+            pretty: Indent output for human reading (default: compact)
             
         Returns:
             Path to saved JSON file
         """
         output_path = self.output_dir / f"{filename}.json"
         
-        # Convert to dict
-        fig_dict = fig.to_dict()
+        if include_data:
+            # Plotly's encoder handles numpy arrays natively (orjson when installed)
+            json_str = pio.to_json(fig, pretty=pretty, engine="auto")
+            with open(output_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(json_str)
+            return output_path
         
-        # Optionally remove data to reduce file size (data can be loaded separately)
-        if not include_data:
-            # Keep only layout and config, remove data
-            fig_dict = {
-                'layout': fig_dict.get('layout', {}),
-                'config': fig_dict.get('config', {}),
-            }
+        # Remove data to reduce file size (data can be loaded separately)
+        fig_dict = fig.to_dict()
+        fig_dict = {
+            'layout': fig_dict.get('layout', {}),
+            'config': fig_dict.get('config', {}),
+        }
         
         # Save as JSON
-        with open(output_path, 'w') as f:
-            json.dump(fig_dict, f, indent=2, default=str)
+        _write_json(output_path, fig_dict, pretty)
         
         return output_path
     
@@ -86,16 +101,70 @@ class PlotlyExporter:
         output_path = Path("data/viz/static") / f"{filename}.{format}"
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        fig.write_image(
-            str(output_path),
+        image_bytes = pio.to_image(
+            fig,
             format=format,
             width=width,
             height=height,
             scale=scale,
         )
+        output_path.write_bytes(image_bytes)
         
         return output_path
     
+    def export_static_images(
+        self,
+        figures: Dict[str, go.Figure],
+        format: str = "png",
+        width: int = 1200,
+        height: int = 800,
+        scale: int = 2,
+    ) -> List[Path]:
+        """
+        Export several Plotly figures as static images in one Kaleido session.
+        
+        Args:
+            figures: Mapping of output filename (without extension) to figure
+            format: Image format (png, jpg, svg, pdf, webp)
+            width: Image width
+            height: Image height
+            scale: Scale factor for higher resolution
+            
+        Returns:
+            List of paths to saved images (empty if kaleido not available)
+        """
+        if importlib.util.find_spec("kaleido") is None:
+            print("Kaleido not installed. Install with: pip install kaleido")
+            return []
+        
+        output_dir = Path("data/viz/static")
+        output_dir.mkdir(parents=True, exist_ok=True)
+        paths = [output_dir / f"{name}.{format}" for name in figures]
+        
+        if hasattr(pio, "write_images") and _kaleido_major_version() >= 1:
+            # Plotly >= 6.1 with Kaleido >= 1.0 renders the whole batch in a
+            # single browser process
+            pio.write_images(
+                list(figures.values()),
+                [str(p) for p in paths],
+                format=format,
+                width=width,
+                height=height,
+                scale=scale,
+            )
+        else:
+            # Older Kaleido reuses one long-lived subprocess across calls
+            for fig, path in zip(figures.values(), paths):
+                path.write_bytes(pio.to_image(
+                    fig,
+                    format=format,
+                    width=width,
+                    height=height,
+                    scale=scale,
+                ))
+        
+        return paths
+    
     def get_figure_json(self, fig: go.Figure) -> Dict[str, Any]:
         """
         Get figure as JSON dict without saving.
@@ -41,6 +41,22 @@ class StaticExporter:
         Returns:
             Path to saved file
         """
+        output_path = self._save_one(fig, filename, format, dpi, bbox_inches, **kwargs)
+        
+        plt.close(fig)  # Close figure to free memory
+        
+        return output_path
+    
+    def _save_one(
+        self,
+        fig: plt.Figure,
+        filename: str,
+        format: str,
+        dpi: int,
+        bbox_inches: str = "tight",
+        **kwargs
+    ) -> Path:
+        """Save a figure in one format without closing it."""
         output_path = self.output_dir / f"{filename}.{format}"
         
         fig.savefig(
@@ -51,8 +67,6 @@ class StaticExporter:
             **kwargs
         )
         
-        plt.close(fig)  # Close figure to free memory
-        
         return output_path
     
     def export_seaborn_plot(
@@ -95,9 +109,9 @@ class StaticExporter:
         Returns:
             List of paths to saved files
         """
-        paths = []
-        for fmt in formats:
-            path = self.export_figure(fig, filename, fmt, dpi)
-            paths.append(path)
+        # Keep the figure open until every format is written; savefig on a
+        # shared figure is not thread-safe, so formats are written in turn
+        paths = [self._save_one(fig, filename, fmt, dpi) for fmt in formats]
+        plt.close(fig)
         return paths
 
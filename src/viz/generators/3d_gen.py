@@ -5,12 +5,33 @@ Generates 3D visualizations using Plotly and matplotlib.
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
+
+# plotly.express and matplotlib are imported inside the methods that use them,
+# so the Plotly-only methods never load the matplotlib backend
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
+# Above these sizes Plotly's 3D renderer becomes sluggish in the browser,
+# so inputs are decimated to roughly this many points by default
+MAX_SCATTER_POINTS = 50_000
+MAX_SURFACE_POINTS = 250_000
+
+
+def _stride(a: np.ndarray, k: int) -> np.ndarray:
+    """Keep every k-th sample along each axis of a 1D or 2D array."""
+    return a[::k, ::k] if a.ndim == 2 else a[::k]
+
+
+def _column_array(data: pd.DataFrame, col: str) -> np.ndarray:
+    """Extract a column as a contiguous array (float64 for numeric columns)."""
+    series = data[col]
+    if pd.api.types.is_numeric_dtype(series):
+        return np.ascontiguousarray(series.to_numpy(dtype=np.float64))
+    return series.to_numpy()
 
 
 class ThreeDGenerator:
@@ -18,7 +39,12 @@ class ThreeDGenerator:
     
     def __init__(self):
         """Initialize 3D generator."""
-        pass
+        # Validated once and reused as the starting scene for every figure
+        self._scene_template = go.layout.Scene(
+            xaxis_title="X",
+            yaxis_title="Y",
+            zaxis_title="Z",
+        )
     
     def scatter_3d(
         self,
@@ -29,6 +55,7 @@ class ThreeDGenerator:
         color_col: Optional[str] = None,
         size_col: Optional[str] = None,
         title: str = "",
+        max_points: Optional[int] = MAX_SCATTER_POINTS,
         **kwargs
     ) -> go.Figure:
         """
@@ -42,11 +69,17 @@ class ThreeDGenerator:
             color_col: Optional column for color mapping
             size_col: Optional column for size mapping
             title: Chart title
+            max_points: Uniformly sample rows down to this many (None disables)
             **kwargs: Additional arguments
             
         Returns:
             Plotly figure
         """
+        import plotly.express as px
+        
+        if max_points is not None and len(data) > max_points:
+            data = data.sample(n=max_points, random_state=0)
+        
         fig = px.scatter_3d(
             data,
             x=x_col,
@@ -67,6 +100,8 @@ class ThreeDGenerator:
         z: np.ndarray,
         title: str = "3D Surface",
         colorscale: str = "Viridis",
+        dtype: Optional[type] = np.float32,
+        max_points: Optional[int] = MAX_SURFACE_POINTS,
         **kwargs
     ) -> go.Figure:
         """
@@ -78,11 +113,22 @@ class ThreeDGenerator:
             z: Z values (2D array)
             title: Chart title
             colorscale: Color scale name
+            dtype: Dtype to cast coordinates to (None keeps the input dtype)
+            max_points: Stride-sample the grid down to about this many points (None disables)
             **kwargs: Additional arguments
             
         Returns:
             Plotly figure
         """
+        if dtype is not None:
+            x, y, z = (np.asarray(a, dtype=dtype) for a in (x, y, z))
+        else:
+            x, y, z = (np.asarray(a) for a in (x, y, z))
+        
+        if max_points is not None and z.size > max_points:
+            k = int(np.ceil(np.sqrt(z.size / max_points)))
+            x, y, z = _stride(x, k), _stride(y, k), _stride(z, k)
+        
         fig = go.Figure(data=[go.Surface(
             x=x,
             y=y,
@@ -91,14 +137,8 @@ class ThreeDGenerator:
             **kwargs
         )])
         
-        fig.update_layout(
-            title=title,
-            scene=dict(
-                xaxis_title="X",
-                yaxis_title="Y",
-                zaxis_title="Z",
-            )
-        )
+        fig.update_layout(title=title)
+        fig.layout.scene = self._scene_template
         
         return fig
     
@@ -126,22 +166,20 @@ class ThreeDGenerator:
             Plotly figure
         """
         fig = go.Figure(data=go.Scatter3d(
-            x=data[x_col],
-            y=data[y_col],
-            z=data[z_col],
+            x=_column_array(data, x_col),
+            y=_column_array(data, y_col),
+            z=_column_array(data, z_col),
             mode='lines',
             line=dict(color='blue', width=2),
             **kwargs
         ))
         
-        fig.update_layout(
-            title=title,
-            scene=dict(
-                xaxis_title=x_col,
-                yaxis_title=y_col,
-                zaxis_title=z_col,
-            )
-        )
+        fig.update_layout(title=title)
+        fig.layout.scene = self._scene_template
+        scene = fig.layout.scene
+        scene.xaxis.title.text = x_col
+        scene.yaxis.title.text = y_col
+        scene.zaxis.title.text = z_col
         
         return fig
     
@@ -155,7 +193,7 @@ class ThreeDGenerator:
         title: str = "",
         figsize: tuple = (10, 8),
         **kwargs
-    ) -> plt.Figure:
+    ) -> "plt.Figure":
         """
         Create a 3D scatter plot using matplotlib.
         
@@ -172,24 +210,30 @@ class ThreeDGenerator:
         Returns:
             Matplotlib figure
         """
+        import matplotlib.pyplot as plt
+        
         fig = plt.figure(figsize=figsize)
         ax = fig.add_subplot(111, projection='3d')
         
+        xs = _column_array(data, x_col)
+        ys = _column_array(data, y_col)
+        zs = _column_array(data, z_col)
+        
         if color_col:
             scatter = ax.scatter(
-                data[x_col],
-                data[y_col],
-                data[z_col],
-                c=data[color_col],
+                xs,
+                ys,
+                zs,
+                c=_column_array(data, color_col),
                 cmap='viridis',
                 **kwargs
             )
             plt.colorbar(scatter, ax=ax, label=color_col)
         else:
             ax.scatter(
-                data[x_col],
-                data[y_col],
-                data[z_col],
+                xs,
+                ys,
+                zs,
                 **kwargs
             )
         
@@ -208,8 +252,9 @@ class ThreeDGenerator:
         z: np.ndarray,
         title: str = "3D Surface",
         figsize: tuple = (10, 8),
+        dtype: Optional[type] = np.float32,
         **kwargs
-    ) -> plt.Figure:
+    ) -> "plt.Figure":
         """
         Create a 3D surface plot using matplotlib.
         
@@ -219,11 +264,17 @@ class ThreeDGenerator:
             z: Z values (2D array)
             title: Plot title
             figsize: Figure size
+            dtype: Dtype to cast coordinates to (None keeps the input dtype)
             **kwargs: Additional arguments
             
         Returns:
             Matplotlib figure
         """
+        import matplotlib.pyplot as plt
+        
+        if dtype is not None:
+            x, y, z = (np.asarray(a, dtype=dtype) for a in (x, y, z))
+        
         fig = plt.figure(figsize=figsize)
         ax = fig.add_subplot(111, projection='3d')
         
@@ -4,18 +4,110 @@ Altair Generator
 Generates visualizations using Altair (grammar of graphics).
 """
 
+import functools
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
 import altair as alt
 import pandas as pd
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+
+
+# Number of chart specs kept per generator (cached charts hold no data)
+CHART_CACHE_SIZE = 64
+
+# Frames with more rows than this are written to a side file by "inline_or_json"
+INLINE_MAX_ROWS = 5000
+
+
+def _inline_or_json(data, max_rows: int = INLINE_MAX_ROWS, **json_kwargs):
+    """Data transformer: inline small frames, reference large ones by URL."""
+    if isinstance(data, pd.DataFrame) and len(data) > max_rows:
+        return alt.to_json(data, **json_kwargs)
+    return alt.to_values(data)
+
+
+alt.data_transformers.register("inline_or_json", _inline_or_json)
+
+
+def _chart_cache_key(df: pd.DataFrame) -> Tuple:
+    """Content key for a DataFrame: column names, dtypes and a digest of its rows."""
+    row_hashes = pd.util.hash_pandas_object(df, index=True).values
+    return (
+        tuple(df.columns),
+        tuple(str(t) for t in df.dtypes),
+        hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest(),
+    )
+
+
+def _cache_chart(method):
+    """
+    Memoise a chart method on (data contents, arguments), returning copies.
+    
+    The cache keeps each chart without its data, so it never holds on to
+    caller DataFrames; the frame passed in is attached to the returned copy.
+    """
+    @functools.wraps(method)
+    def wrapper(self, data: pd.DataFrame, *args, **kwargs):
+        try:
+            key = (method.__name__, _chart_cache_key(data), args, tuple(sorted(kwargs.items())))
+            hash(key)
+        except TypeError:
+            # Unhashable cell values or arguments: build without caching
+            return method(self, data, *args, **kwargs)
+        
+        spec = self._chart_cache.get(key)
+        if spec is None:
+            chart = method(self, data, *args, **kwargs)
+            spec = chart.copy()
+            spec.data = alt.Undefined
+            self._chart_cache[key] = spec
+            if len(self._chart_cache) > CHART_CACHE_SIZE:
+                self._chart_cache.popitem(last=False)
+            return chart
+        
+        self._chart_cache.move_to_end(key)
+        
+        # Charts are mutable, so never hand out the cached instance
+        chart = spec.copy()
+        chart.data = data
+        return chart
+    
+    return wrapper
 
 
 class AltairGenerator:
     """Generator for Altair visualizations."""
     
-    def __init__(self):
-        """Initialize Altair generator."""
-        pass
+    def __init__(
+        self,
+        transformer: Optional[str] = None,
+        output_dir: Optional[Path] = None,
+    ):
+        """
+        Initialize Altair generator.
+        
+        Args:
+            transformer: Optional Altair data transformer to enable
+                ("inline_or_json", "json", "vegafusion", ...). Altair's
+                transformer registry is global, so this affects every chart
+                serialised afterwards in the process.
+            output_dir: Directory for data files written by the json transformers
+        """
+        self._chart_cache: OrderedDict = OrderedDict()
+        self.output_dir = output_dir or Path("data/viz/data")
+        self.transformer = transformer
+        
+        if transformer in ("json", "inline_or_json"):
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            alt.data_transformers.enable(
+                transformer,
+                filename=str(self.output_dir / "{prefix}-{hash}.{extension}"),
+            )
+        elif transformer:
+            alt.data_transformers.enable(transformer)
     
+    @_cache_chart
     def line_chart(
         self,
         data: pd.DataFrame,
@@ -53,6 +145,7 @@ class AltairGenerator:
         
         return chart
     
+    @_cache_chart
     def scatter_chart(
         self,
         data: pd.DataFrame,
@@ -98,6 +191,7 @@ class AltairGenerator:
         
         return chart
     
+    @_cache_chart
     def bar_chart(
         self,
         data: pd.DataFrame,
@@ -139,6 +233,7 @@ class AltairGenerator:
         
         return chart
     
+    @_cache_chart
     def heatmap(
         self,
         data: pd.DataFrame,
@@ -6,11 +6,35 @@ Note: Bokeh charts are typically embedded in HTML or served via Bokeh server.
 This generator creates Bokeh figures that can be exported or served.
 """
 
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
 from bokeh.plotting import figure
-from bokeh.models import ColumnDataSource, HoverTool
+from bokeh.models import ColumnDataSource
 from bokeh.layouts import column, row
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+
+
+# Number of DataFrames whose column arrays are kept per generator
+CDS_CACHE_SIZE = 32
+
+# Toolbar shared by all charts; the hover tool is built by figure() from tooltips=
+CHART_TOOLS = "pan,wheel_zoom,box_zoom,reset,save,hover"
+
+
+@lru_cache(maxsize=128)
+def _tooltips(x_col: str, y_col: Optional[str] = None) -> Tuple[Tuple[str, str], ...]:
+    """
+    Tooltip fields for a chart, built once per column pair.
+    
+    Without y_col the tooltips describe multi-line series, which have no
+    per-point columns to reference.
+    """
+    if y_col is None:
+        return (("Series", "@label"), (x_col, "$x"), ("Value", "$y"))
+    return ((x_col, f"@{{{x_col}}}"), (y_col, f"@{{{y_col}}}"))
 
 
 class BokehGenerator:
@@ -26,6 +50,64 @@ class BokehGenerator:
         """
         self.width = width
         self.height = height
+        self._cds_cache: OrderedDict = OrderedDict()
+    
+    def _get_cache_entry(
+        self, data: pd.DataFrame
+    ) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """
+        Get the column arrays and string factor columns cached for a DataFrame.
+        
+        Entries are keyed on the frame's identity and shape, so a frame that is
+        modified in place after plotting must be copied to pick up the change.
+        """
+        key = (id(data), len(data), tuple(data.columns))
+        cached = self._cds_cache.get(key)
+        if cached is not None and cached[0]() is data:
+            self._cds_cache.move_to_end(key)
+            return cached[1], cached[2]
+        
+        # A dict of ndarrays skips Bokeh's per-cell validation of DataFrames
+        columns = {str(c): data[c].to_numpy() for c in data.columns}
+        if 'index' not in columns:
+            columns = {'index': data.index.to_numpy(), **columns}
+        
+        factors: Dict[str, np.ndarray] = {}
+        
+        self._cds_cache[key] = (weakref.ref(data), columns, factors)
+        if len(self._cds_cache) > CDS_CACHE_SIZE:
+            self._cds_cache.popitem(last=False)
+        
+        return columns, factors
+    
+    def _get_columns(self, data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """Get the column arrays for a DataFrame, reusing ones built earlier."""
+        return self._get_cache_entry(data)[0]
+    
+    def _get_factors(self, data: pd.DataFrame, col: str) -> np.ndarray:
+        """
+        Get a column as the string factors Bokeh categorical axes require.
+        
+        The converted array is cached alongside the frame's other columns, so
+        the frame itself is never copied.
+        """
+        factors = self._get_cache_entry(data)[1]
+        name = str(col)
+        if name not in factors:
+            values = data[col]
+            if not pd.api.types.is_string_dtype(values):
+                values = values.astype(str)
+            factors[name] = values.to_numpy()
+        return factors[name]
+    
+    def _get_source(self, data: pd.DataFrame) -> ColumnDataSource:
+        """
+        Build a ColumnDataSource for a DataFrame from its cached column arrays.
+        
+        Each chart gets its own source, since a Bokeh model can belong to only
+        one document and shared sources would also link selections.
+        """
+        return ColumnDataSource(data=dict(self._get_columns(data)))
     
     def line_chart(
         self,
@@ -52,31 +134,40 @@ class BokehGenerator:
         Returns:
             Bokeh figure
         """
+        # All series share one WebGL-rendered glyph unless overridden
+        kwargs.setdefault("output_backend", "webgl")
         p = figure(
             width=self.width,
             height=self.height,
             title=title,
             x_axis_label=xlabel,
             y_axis_label=ylabel,
-            tools="pan,wheel_zoom,box_zoom,reset,save",
+            tools=CHART_TOOLS,
+            tooltips=list(_tooltips(x_col)),
             **kwargs
         )
         
-        source = ColumnDataSource(data)
+        columns = self._get_columns(data)
+        x_arr = columns[str(x_col)]
         
+        # One row per series: a single multi_line renderer replaces one line per column
         colors = ['blue', 'red', 'green', 'orange', 'purple']
-        for i, y_col in enumerate(y_cols):
-            p.line(
-                x=x_col,
-                y=y_col,
-                source=source,
-                legend_label=y_col,
-                line_width=2,
-                color=colors[i % len(colors)],
-            )
+        lines = ColumnDataSource(data={
+            'xs': [x_arr] * len(y_cols),
+            'ys': [columns[str(y_col)] for y_col in y_cols],
+            'color': [colors[i % len(colors)] for i in range(len(y_cols))],
+            'label': [str(y_col) for y_col in y_cols],
+        })
+        p.multi_line(
+            xs='xs',
+            ys='ys',
+            source=lines,
+            line_color='color',
+            line_width=2,
+            legend_field='label',
+        )
         
         p.legend.location = "top_left"
-        p.add_tools(HoverTool(tooltips=[(x_col, f"@{x_col}"), ("Value", f"$y")]))
         
         return p
     
@@ -109,11 +200,12 @@ class BokehGenerator:
             width=self.width,
             height=self.height,
             title=title,
-            tools="pan,wheel_zoom,box_zoom,reset,save",
+            tools=CHART_TOOLS,
+            tooltips=list(_tooltips(x_col, y_col)),
             **kwargs
         )
         
-        source = ColumnDataSource(data)
+        source = self._get_source(data)
         
         size = size_col if size_col else 10
         
@@ -126,8 +218,6 @@ class BokehGenerator:
             color='blue' if not color_col else color_col,
         )
         
-        p.add_tools(HoverTool(tooltips=[(x_col, f"@{x_col}"), (y_col, f"@{y_col}")]))
-        
         return p
     
     def bar_chart(
@@ -151,16 +241,21 @@ class BokehGenerator:
         Returns:
             Bokeh figure
         """
+        # Factors must be unique strings; the source's x column is swapped for
+        # the cached string version so it matches the range
+        x_factors = self._get_factors(data, x_col)
+        
         p = figure(
             width=self.width,
             height=self.height,
             title=title,
-            x_range=data[x_col].tolist(),
-            tools="pan,wheel_zoom,box_zoom,reset,save",
+            x_range=list(pd.unique(x_factors)),
+            tools=CHART_TOOLS,
+            tooltips=list(_tooltips(x_col, y_col)),
             **kwargs
         )
         
-        source = ColumnDataSource(data)
+        source = ColumnDataSource(data={**self._get_columns(data), str(x_col): x_factors})
         
         p.vbar(
             x=x_col,
@@ -171,7 +266,6 @@ class BokehGenerator:
         )
         
         p.xaxis.major_label_orientation = "vertical"
-        p.add_tools(HoverTool(tooltips=[(x_col, f"@{x_col}"), (y_col, f"@{y_col}")]))
         
         return p
 
@@ -2,15 +2,122 @@
 Geospatial Generator
 
 Generates map visualizations using folium and plotly.
+Figure serialisation is much faster with orjson installed (pip install orjson),
+which plotly's default "auto" JSON engine picks up automatically, and numeric
+trace data is kept as ndarrays so plotly >= 6 writes it as base64 typed arrays.
 """
 
-import folium
-import plotly.express as px
+import functools
 import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
 from pathlib import Path
 
+# folium and plotly.express are imported inside the methods that use them
+if TYPE_CHECKING:
+    import folium
+
+
+# Above this many points folium_map clusters markers client-side
+FAST_MARKER_THRESHOLD = 1000
+
+# Builds each clustered marker in the browser from a [lat, lon, popup, color] row
+_FAST_MARKER_CALLBACK = """
+function (row) {
+    var icon = L.AwesomeMarkers.icon({
+        icon: 'info-sign', prefix: 'glyphicon', markerColor: row[3]
+    });
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+    marker.bindPopup(row[2]);
+    return marker;
+};
+"""
+
+_FAST_CIRCLE_CALLBACK = """
+function (row) {
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+        radius: 5, color: row[3], fill: true, fillOpacity: 0.7
+    });
+    marker.bindPopup(row[2]);
+    return marker;
+};
+"""
+
+# Numeric trace properties that plotly can ship as base64 typed arrays
+TYPED_ARRAY_PROPS = ("lat", "lon", "z", "marker.size", "marker.color")
+
+
+def _encode_typed_arrays(fig: go.Figure) -> go.Figure:
+    """
+    Store numeric map trace data as ndarrays.
+    
+    plotly >= 6 serialises ndarray properties as base64 typed arrays
+    ({"dtype", "bdata"}) instead of decimal text; lists and tuples of numbers
+    would still be written element by element.
+    """
+    for trace in fig.data:
+        for prop in TYPED_ARRAY_PROPS:
+            if prop not in trace:
+                continue
+            value = trace[prop]
+            if not isinstance(value, (list, tuple)):
+                continue
+            arr = np.asarray(value)
+            if arr.dtype.kind in "iuf":
+                trace[prop] = arr
+    
+    return fig
+
+
+def _build_choropleth(
+    data: pd.DataFrame,
+    location_col: str,
+    value_col: str,
+    title: str,
+    **kwargs
+) -> go.Figure:
+    """Build a choropleth figure with the standard geo layout."""
+    import plotly.express as px
+    
+    fig = px.choropleth(
+        data,
+        locations=location_col,
+        color=value_col,
+        title=title,
+        **kwargs
+    )
+    
+    fig.update_layout(
+        geo=dict(
+            showframe=False,
+            showcoastlines=True,
+            projection_type='equirectangular'
+        )
+    )
+    
+    return fig
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_choropleth(
+    locations: Tuple[Any, ...],
+    values: Tuple[float, ...],
+    location_col: str,
+    value_col: str,
+    title: str,
+) -> go.Figure:
+    """
+    Choropleth figure memoised on its location/value contents.
+    
+    The cached figure is shared, so callers must return a copy of it.
+    """
+    data = pd.DataFrame({
+        location_col: list(locations),
+        value_col: np.asarray(values, dtype=np.float32),
+    })
+    return _encode_typed_arrays(_build_choropleth(data, location_col, value_col, title))
+
 
 class GeospatialGenerator:
     """Generator for geospatial visualizations."""
@@ -42,23 +149,22 @@ class GeospatialGenerator:
         Returns:
             Plotly figure
         """
-        fig = px.choropleth(
-            data,
-            locations=location_col,
-            color=value_col,
-            title=title,
-            **kwargs
-        )
-        
-        fig.update_layout(
-            geo=dict(
-                showframe=False,
-                showcoastlines=True,
-                projection_type='equirectangular'
+        if kwargs:
+            # Extra px arguments may reference other columns, so skip the cache
+            data = data.assign(**{value_col: data[value_col].astype(np.float32)})
+            return _encode_typed_arrays(
+                _build_choropleth(data, location_col, value_col, title, **kwargs)
             )
-        )
         
-        return fig
+        cached = _cached_choropleth(
+            tuple(data[location_col]),
+            tuple(data[value_col].astype(np.float32)),
+            location_col,
+            value_col,
+            title,
+        )
+        # Deep copy, so callers can modify the figure without touching the cache
+        return go.Figure(cached)
     
     def scatter_map(
         self,
@@ -85,6 +191,14 @@ class GeospatialGenerator:
         Returns:
             Plotly figure
         """
+        import plotly.express as px
+        
+        # float32 keeps ~1m precision and halves the serialised coordinates
+        data = data.assign(**{
+            lat_col: data[lat_col].astype(np.float32),
+            lon_col: data[lon_col].astype(np.float32),
+        })
+        
         fig = px.scatter_geo(
             data,
             lat=lat_col,
@@ -103,7 +217,7 @@ class GeospatialGenerator:
             )
         )
         
-        return fig
+        return _encode_typed_arrays(fig)
     
     def folium_map(
         self,
@@ -115,7 +229,9 @@ class GeospatialGenerator:
         center: Optional[List[float]] = None,
         zoom_start: int = 5,
         save_path: Optional[Path] = None,
-    ) -> folium.Map:
+        cluster_threshold: Optional[int] = FAST_MARKER_THRESHOLD,
+        marker_style: str = "icon",
+    ) -> "folium.Map":
         """
         Create a Folium interactive map.
         
@@ -128,10 +244,17 @@ class GeospatialGenerator:
             center: Map center [lat, lon]
             zoom_start: Initial zoom level
             save_path: Optional path to save HTML file
+            cluster_threshold: Use a client-side FastMarkerCluster when there are
+                more points than this (None always adds individual markers)
+            marker_style: "icon" for pin markers, or "circle" for lightweight
+                vector CircleMarkers that skip folium's Icon objects entirely
             
         Returns:
             Folium map object
         """
+        import folium
+        from folium.plugins import FastMarkerCluster
+        
         # Determine center if not provided
         if center is None:
             center = [data[lat_col].mean(), data[lon_col].mean()]
@@ -139,23 +262,47 @@ class GeospatialGenerator:
         # Create map
         m = folium.Map(location=center, zoom_start=zoom_start)
         
+        # Extract columns once rather than building a Series per row
+        lats = data[lat_col].to_numpy()
+        lons = data[lon_col].to_numpy()
+        if popup_col:
+            popups = data[popup_col].astype(str).to_numpy()
+        else:
+            popups = np.array([f"Point {idx}" for idx in data.index], dtype=object)
+        
+        # Determine color (simple median split, can be enhanced)
+        if color_col:
+            values = data[color_col].to_numpy()
+            colors = np.where(values > data[color_col].median(), 'red', 'blue')
+        else:
+            colors = np.full(len(data), 'blue')
+        
         # Add markers
-        for idx, row in data.iterrows():
-            popup_text = str(row[popup_col]) if popup_col else f"Point {idx}"
-            
-            # Determine color
-            if color_col:
-                # Simple color mapping (can be enhanced)
-                value = row[color_col]
-                color = 'red' if value > data[color_col].median() else 'blue'
-            else:
-                color = 'blue'
-            
-            folium.Marker(
-                location=[row[lat_col], row[lon_col]],
-                popup=popup_text,
-                icon=folium.Icon(color=color),
-            ).add_to(m)
+        if cluster_threshold is not None and len(data) > cluster_threshold:
+            # One serialised array; markers are created by the JS callback
+            points = [
+                list(point)
+                for point in zip(lats.tolist(), lons.tolist(), popups.tolist(), colors.tolist())
+            ]
+            callback = _FAST_CIRCLE_CALLBACK if marker_style == "circle" else _FAST_MARKER_CALLBACK
+            FastMarkerCluster(points, callback=callback).add_to(m)
+        elif marker_style == "circle":
+            for lat, lon, popup_text, color in zip(lats, lons, popups, colors):
+                folium.CircleMarker(
+                    location=[lat, lon],
+                    popup=popup_text,
+                    radius=5,
+                    color=color,
+                    fill=True,
+                    fill_opacity=0.7,
+                ).add_to(m)
+        else:
+            for lat, lon, popup_text, color in zip(lats, lons, popups, colors):
+                folium.Marker(
+                    location=[lat, lon],
+                    popup=popup_text,
+                    icon=folium.Icon(color=color),
+                ).add_to(m)
         
         # Save if path provided
         if save_path:
@@ -186,10 +333,16 @@ class GeospatialGenerator:
         Returns:
             Plotly figure
         """
+        # Extract each column once; ndarrays take the encoder's numpy fast
+        # path (orjson when installed) and are reused for the map center
+        lats = data[lat_col].to_numpy(dtype=np.float32)
+        lons = data[lon_col].to_numpy(dtype=np.float32)
+        weights = data[weight_col].to_numpy(dtype=np.float32)
+        
         fig = go.Figure(go.Densitymapbox(
-            lat=data[lat_col],
-            lon=data[lon_col],
-            z=data[weight_col],
+            lat=lats,
+            lon=lons,
+            z=weights,
             radius=10,
             **kwargs
         ))
@@ -198,13 +351,13 @@ class GeospatialGenerator:
             mapbox=dict(
                 style='open-street-map',
                 center=dict(
-                    lat=data[lat_col].mean(),
-                    lon=data[lon_col].mean()
+                    lat=float(np.nanmean(lats, dtype=np.float64)),
+                    lon=float(np.nanmean(lons, dtype=np.float64))
                 ),
                 zoom=5
             ),
             title=title,
         )
         
-        return fig
+        return _encode_typed_arrays(fig)
 
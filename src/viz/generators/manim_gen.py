@@ -4,19 +4,320 @@ Manim Animation Generator
 Generates mathematical animations for stock market data using Manim.
 """
 
+import functools
+import importlib.util
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 import json
+from dataclasses import dataclass
 
 try:
-    from manim import *
-    MANIM_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    MANIM_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Manim pulls in Cairo, Pango and moviepy, so it is only imported by the
+# methods that build scenes; the metadata-only methods never load it
+MANIM_AVAILABLE = importlib.util.find_spec("manim") is not None
+if not MANIM_AVAILABLE:
     print("Warning: Manim not installed. Install with: pip install manim")
 
+# Quantization step for correlation matrices stored as int8 (value = q / scale)
+CORRELATION_SCALE = 127.0
+
+# Pre-serialised metadata layouts for the fixed-shape, scalar-only payloads;
+# each field is filled with its JSON encoding by _write_metadata_template
+_STOCK_METADATA_TEMPLATE = (
+    '{{\n'
+    '  "type": "manim_stock_animation",\n'
+    '  "output_name": {output_name},\n'
+    '  "data_points": {data_points},\n'
+    '  "price_range": [{price_min}, {price_max}],\n'
+    '  "show_equation": {show_equation},\n'
+    '  "show_derivative": {show_derivative}\n'
+    '}}'
+)
+
+_FOURIER_METADATA_TEMPLATE = (
+    '{{\n'
+    '  "type": "manim_fourier_animation",\n'
+    '  "output_name": {output_name},\n'
+    '  "data_points": {data_points},\n'
+    '  "num_frequencies": {num_frequencies},\n'
+    '  "spectrum_path": {spectrum_path}\n'
+    '}}'
+)
+
+_PRICE_EVOLUTION_METADATA_TEMPLATE = (
+    '{{\n'
+    '  "type": "manim_price_evolution",\n'
+    '  "output_name": {output_name},\n'
+    '  "year_col": {year_col},\n'
+    '  "price_col": {price_col},\n'
+    '  "data_points": {data_points},\n'
+    '  "year_range": [{year_min}, {year_max}]\n'
+    '}}'
+)
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert numpy values for the stdlib json fallback."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _centered_moving_average(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Centered simple moving average, NaN where the window is incomplete.
+    
+    Matches pd.Series(x).rolling(window, center=True).mean() using a single
+    cumulative sum instead of pandas' rolling machinery.
+    """
+    n = len(x)
+    out = np.full(n, np.nan, dtype=np.float64)
+    if window < 1 or window > n:
+        return out
+    
+    csum = np.concatenate(([0.0], np.cumsum(x, dtype=np.float64)))
+    means = (csum[window:] - csum[:-window]) / window
+    lead = window // 2
+    out[lead:lead + len(means)] = means
+    return out
+
+
+def _centered_sma_norm_py(x: np.ndarray, window: int, pmin: float, rng: float) -> np.ndarray:
+    """
+    Centered moving average normalized to the 0-1 price range in one pass.
+    
+    Running-sum loop with the same alignment and NaN edges as
+    _centered_moving_average; compiled with numba when it is installed.
+    """
+    n = x.size
+    out = np.full(n, np.nan, dtype=np.float64)
+    if window < 1 or window > n:
+        return out
+    
+    lead = window // 2
+    s = 0.0
+    for i in range(window):
+        s += x[i]
+    for j in range(n - window + 1):
+        out[j + lead] = (s / window - pmin) / rng
+        if j + window < n:
+            s += x[j + window] - x[j]
+    return out
+
+
+if NUMBA_AVAILABLE:
+    _centered_sma_norm = njit(cache=True)(_centered_sma_norm_py)
+else:
+    def _centered_sma_norm(x: np.ndarray, window: int, pmin: float, rng: float) -> np.ndarray:
+        """NumPy fallback for the numba kernel."""
+        return (_centered_moving_average(x, window) - pmin) / rng
+
+
+def _top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Positions of the k largest values, largest first, without a full sort.
+    
+    Equal values are ranked by position, including at the k boundary, and
+    NaNs rank after every number (-inf included), in position order. This
+    matches sort_values(ascending=False).head(k).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    k = max(0, min(k, len(values)))
+    is_nan = np.isnan(values)
+    valid = np.flatnonzero(~is_nan)
+    
+    if k > len(valid):
+        # Every number is taken; NaNs fill the rest
+        order = valid[np.argsort(-values[valid], kind="stable")]
+        return np.concatenate([order, np.flatnonzero(is_nan)[:k - len(valid)]])
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    
+    # Keep everything above the k-th largest value, then the earliest ties
+    nums = values[valid]
+    threshold = np.partition(nums, len(nums) - k)[len(nums) - k]
+    above = valid[nums > threshold]
+    ties = valid[nums == threshold][:k - len(above)]
+    idx = np.sort(np.concatenate([above, ties]))
+    return idx[np.argsort(-values[idx], kind="stable")]
+
+
+def _axes_points(axes, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """
+    Map data coordinates to scene points for linear Axes in one vectorized step.
+    
+    Equivalent to calling axes.coords_to_point(x, y) per point: the affine
+    transform is recovered from three reference points.
+    """
+    origin = np.asarray(axes.coords_to_point(0, 0), dtype=np.float64)
+    x_hat = np.asarray(axes.coords_to_point(1, 0), dtype=np.float64) - origin
+    y_hat = np.asarray(axes.coords_to_point(0, 1), dtype=np.float64) - origin
+    return origin + np.outer(xs, x_hat) + np.outer(ys, y_hat)
+
+
+@dataclass(frozen=True)
+class StockSceneConfig:
+    """
+    Precomputed series and options for StockPriceScene.
+    """
+    title: str
+    normalized_prices: np.ndarray
+    normalized_ma: np.ndarray
+    derivative: np.ndarray
+    show_equation: bool = True
+    show_derivative: bool = True
+
+
+@functools.lru_cache(maxsize=1)
+def _stock_price_scene_class():
+    """
+    Define StockPriceScene once per process.
+    
+    Scene subclasses need manim at class-definition time, and manim is only
+    imported when a scene is actually requested.
+    """
+    from manim import (
+        Scene, Text, Axes, VMobject, Dot, MathTex,
+        Create, Write, FadeOut, linear,
+        UP, DOWN, LEFT, RIGHT, UR,
+        WHITE, BLUE, YELLOW, RED, GREEN, PURPLE,
+    )
+    
+    class StockPriceScene(Scene):
+        """Animated price line with optional moving average and derivative."""
+        
+        def __init__(self, scene_config: StockSceneConfig, **kwargs):
+            self.cfg = scene_config
+            super().__init__(**kwargs)
+        
+        def construct(self):
+            cfg = self.cfg
+            normalized_prices = cfg.normalized_prices
+            normalized_ma = cfg.normalized_ma
+            derivative = cfg.derivative
+            
+            # Title
+            title_text = Text(cfg.title, font_size=48, color=WHITE)
+            title_text.to_edge(UP)
+            self.add(title_text)
+            
+            # Create axes
+            axes = Axes(
+                x_range=[0, len(normalized_prices), 10],
+                y_range=[0, 1.2, 0.2],
+                x_length=10,
+                y_length=6,
+                axis_config={"color": BLUE},
+                tips=False,
+            )
+            axes.shift(DOWN * 0.5)
+            
+            # Labels
+            x_label = axes.get_x_axis_label("Time", direction=DOWN, buff=0.5)
+            y_label = axes.get_y_axis_label("Normalized Price", direction=LEFT, buff=0.5)
+            
+            self.add(axes, x_label, y_label)
+            
+            # Create data points as one (N, 3) array that Manim can take as is
+            indices = np.arange(len(normalized_prices))
+            points = _axes_points(axes, indices, normalized_prices)
+            
+            # Animate line drawing
+            line = VMobject()
+            line.set_points_as_corners(points)
+            line.set_stroke(color=YELLOW, width=4)
+            
+            # Animate the line
+            self.play(Create(line), run_time=3)
+            
+            # Add moving dot along the line
+            dot = Dot(color=RED, radius=0.1)
+            dot.move_to(points[0])
+            self.add(dot)
+            
+            # Animate dot moving along the line
+            self.play(
+                dot.animate.move_to(points[-1]),
+                run_time=2,
+                rate_func=linear
+            )
+            
+            # Show mathematical annotations
+            if cfg.show_equation:
+                # Draw moving average line
+                valid = ~np.isnan(normalized_ma)
+                ma_points = _axes_points(axes, indices[valid], normalized_ma[valid])
+                
+                if len(ma_points):
+                    ma_line = VMobject()
+                    ma_line.set_points_as_corners(ma_points)
+                    ma_line.set_stroke(color=GREEN, width=3, opacity=0.7)
+                    self.play(Create(ma_line), run_time=1.5)
+                    
+                    # Show equation
+                    eq_text = MathTex(
+                        r"\text{MA}(t) = \frac{1}{n}\sum_{i=t-n}^{t} P(i)",
+                        font_size=36,
+                        color=GREEN
+                    )
+                    eq_text.to_corner(UR, buff=0.5)
+                    self.play(Write(eq_text), run_time=1)
+            
+            # Show derivative (rate of change)
+            if cfg.show_derivative:
+                # Create derivative axes
+                deriv_axes = Axes(
+                    x_range=[0, len(normalized_prices), 10],
+                    y_range=[min(derivative) - 0.1, max(derivative) + 0.1, 0.1],
+                    x_length=10,
+                    y_length=3,
+                    axis_config={"color": PURPLE},
+                    tips=False,
+                )
+                deriv_axes.next_to(axes, DOWN, buff=0.3)
+                
+                deriv_label = deriv_axes.get_y_axis_label("Rate of Change", direction=LEFT, buff=0.3)
+                self.add(deriv_axes, deriv_label)
+                
+                # Draw derivative
+                deriv_points = _axes_points(deriv_axes, indices, derivative)
+                
+                deriv_line = VMobject()
+                deriv_line.set_points_as_corners(deriv_points)
+                deriv_line.set_stroke(color=PURPLE, width=3)
+                
+                self.play(Create(deriv_line), run_time=2)
+                
+                # Show derivative equation
+                deriv_eq = MathTex(
+                    r"\frac{dP}{dt} = \lim_{\Delta t \to 0} \frac{P(t+\Delta t) - P(t)}{\Delta t}",
+                    font_size=32,
+                    color=PURPLE
+                )
+                deriv_eq.next_to(deriv_axes, RIGHT, buff=0.5)
+                self.play(Write(deriv_eq), run_time=1.5)
+            
+            # Fade out
+            self.wait(1)
+            self.play(FadeOut(*self.mobjects), run_time=1)
+    
+    return StockPriceScene
+
 
 class ManimGenerator:
     """Generator for Manim mathematical animations."""
@@ -34,6 +335,52 @@ class ManimGenerator:
         self.output_dir = output_dir or Path("data/viz/static")
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
+    def _write_metadata(self, output_name: str, metadata: Dict[str, Any]) -> Path:
+        """
+        Write render metadata next to the animation output.
+        
+        Args:
+            output_name: Output filename (without extension)
+            metadata: Metadata dictionary (may contain numpy values)
+            
+        Returns:
+            Path to saved metadata file
+        """
+        metadata_path = self.output_dir / f"{output_name}_metadata.json"
+        
+        if ORJSON_AVAILABLE:
+            metadata_path.write_bytes(orjson.dumps(
+                metadata,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            ))
+        else:
+            metadata_path.write_text(json.dumps(metadata, indent=2, default=_json_default))
+        
+        return metadata_path
+    
+    def _write_metadata_template(self, output_name: str, template: str, /, **fields: Any) -> Path:
+        """
+        Write render metadata from a pre-serialised template.
+        
+        Only the variable fields are encoded, so no metadata dict is built
+        and the indentation is fixed in the template.
+        
+        Args:
+            output_name: Output filename (without extension), also filled
+                into the template's output_name placeholder
+            template: str.format template with one placeholder per field
+            **fields: Scalar field values (may be numpy scalars)
+            
+        Returns:
+            Path to saved metadata file
+        """
+        metadata_path = self.output_dir / f"{output_name}_metadata.json"
+        fields = {"output_name": output_name, **fields}
+        encoded = {key: json.dumps(value, default=_json_default) for key, value in fields.items()}
+        metadata_path.write_text(template.format(**encoded))
+        
+        return metadata_path
+    
     def stock_price_animation(
         self,
         data: pd.DataFrame,
@@ -43,6 +390,7 @@ class ManimGenerator:
         output_name: str = "stock_animation",
         show_equation: bool = True,
         show_derivative: bool = True,
+        render: bool = False,
     ) -> Path:
         """
         Create an animated stock price chart with mathematical annotations.
@@ -55,6 +403,8 @@ class ManimGenerator:
             output_name: Output filename (without extension)
             show_equation: Whether to show mathematical equations
             show_derivative: Whether to show derivative (rate of change)
+            render: Render the scene in-process (slow); otherwise only the
+                metadata is written and the returned path is a placeholder
             
         Returns:
             Path to rendered video file
@@ -67,157 +417,48 @@ class ManimGenerator:
         prices = data[price_col].values
         dates = pd.to_datetime(data[date_col]).values
         
-        # Normalize prices for visualization (0-1 range)
-        price_min, price_max = prices.min(), prices.max()
-        normalized_prices = (prices - price_min) / (price_max - price_min) if price_max > price_min else prices
-        
-        # Create Manim scene
-        class StockPriceScene(Scene):
-            def construct(self):
-                # Title
-                title_text = Text(title, font_size=48, color=WHITE)
-                title_text.to_edge(UP)
-                self.add(title_text)
-                
-                # Create axes
-                axes = Axes(
-                    x_range=[0, len(prices), 10],
-                    y_range=[0, 1.2, 0.2],
-                    x_length=10,
-                    y_length=6,
-                    axis_config={"color": BLUE},
-                    tips=False,
-                )
-                axes.shift(DOWN * 0.5)
-                
-                # Labels
-                x_label = axes.get_x_axis_label("Time", direction=DOWN, buff=0.5)
-                y_label = axes.get_y_axis_label("Normalized Price", direction=LEFT, buff=0.5)
-                
-                self.add(axes, x_label, y_label)
-                
-                # Create data points
-                points = []
-                for i, price in enumerate(normalized_prices):
-                    point = axes.coords_to_point(i, price)
-                    points.append(point)
-                
-                # Animate line drawing
-                line = VMobject()
-                line.set_points_as_corners(points)
-                line.set_stroke(color=YELLOW, width=4)
-                
-                # Animate the line
-                self.play(Create(line), run_time=3)
-                
-                # Add moving dot along the line
-                dot = Dot(color=RED, radius=0.1)
-                dot.move_to(points[0])
-                self.add(dot)
-                
-                # Animate dot moving along the line
-                self.play(
-                    dot.animate.move_to(points[-1]),
-                    run_time=2,
-                    rate_func=linear
-                )
-                
-                # Show mathematical annotations
-                if show_equation:
-                    # Calculate moving average
-                    window = min(20, len(prices) // 4)
-                    moving_avg = pd.Series(prices).rolling(window=window, center=True).mean()
-                    normalized_ma = (moving_avg - price_min) / (price_max - price_min)
-                    
-                    # Draw moving average line
-                    ma_points = []
-                    for i, ma_val in enumerate(normalized_ma):
-                        if not np.isnan(ma_val):
-                            point = axes.coords_to_point(i, ma_val)
-                            ma_points.append(point)
-                    
-                    if ma_points:
-                        ma_line = VMobject()
-                        ma_line.set_points_as_corners(ma_points)
-                        ma_line.set_stroke(color=GREEN, width=3, opacity=0.7)
-                        self.play(Create(ma_line), run_time=1.5)
-                        
-                        # Show equation
-                        eq_text = MathTex(
-                            r"\text{MA}(t) = \frac{1}{n}\sum_{i=t-n}^{t} P(i)",
-                            font_size=36,
-                            color=GREEN
-                        )
-                        eq_text.to_corner(UR, buff=0.5)
-                        self.play(Write(eq_text), run_time=1)
-                
-                # Show derivative (rate of change)
-                if show_derivative:
-                    # Calculate derivative
-                    derivative = np.gradient(normalized_prices)
-                    
-                    # Create derivative axes
-                    deriv_axes = Axes(
-                        x_range=[0, len(prices), 10],
-                        y_range=[min(derivative) - 0.1, max(derivative) + 0.1, 0.1],
-                        x_length=10,
-                        y_length=3,
-                        axis_config={"color": PURPLE},
-                        tips=False,
-                    )
-                    deriv_axes.next_to(axes, DOWN, buff=0.3)
-                    
-                    deriv_label = deriv_axes.get_y_axis_label("Rate of Change", direction=LEFT, buff=0.3)
-                    self.add(deriv_axes, deriv_label)
-                    
-                    # Draw derivative
-                    deriv_points = []
-                    for i, deriv_val in enumerate(derivative):
-                        point = deriv_axes.coords_to_point(i, deriv_val)
-                        deriv_points.append(point)
-                    
-                    deriv_line = VMobject()
-                    deriv_line.set_points_as_corners(deriv_points)
-                    deriv_line.set_stroke(color=PURPLE, width=3)
-                    
-                    self.play(Create(deriv_line), run_time=2)
-                    
-                    # Show derivative equation
-                    deriv_eq = MathTex(
-                        r"\frac{dP}{dt} = \lim_{\Delta t \to 0} \frac{P(t+\Delta t) - P(t)}{\Delta t}",
-                        font_size=32,
-                        color=PURPLE
-                    )
-                    deriv_eq.next_to(deriv_axes, RIGHT, buff=0.5)
-                    self.play(Write(deriv_eq), run_time=1.5)
-                
-                # Fade out
-                self.wait(1)
-                self.play(FadeOut(*self.mobjects), run_time=1)
-        
-        # Render animation
-        # Note: This is a simplified version. In practice, you'd need to:
-        # 1. Save this as a .py file
-        # 2. Run: manim -pql scene_file.py StockPriceScene
-        # 3. Return the path to the rendered video
-        
-        # For now, return a placeholder path
-        # In a real implementation, you'd use Manim's CLI or programmatic rendering
+        # Normalize prices for visualization (0-1 range) in one pass
+        arr = np.ascontiguousarray(prices, dtype=np.float64)
+        price_min, price_max = arr.min(), arr.max()
+        price_range = (price_max - price_min) or 1.0
+        normalized_prices = (arr - price_min) * (1.0 / price_range)
+        
         output_path = self.output_dir / f"{output_name}.mp4"
         
-        # Save metadata for rendering
-        metadata = {
-            "type": "manim_stock_animation",
-            "output_name": output_name,
-            "data_points": len(prices),
-            "price_range": [float(price_min), float(price_max)],
-            "show_equation": show_equation,
-            "show_derivative": show_derivative,
-        }
+        if render:
+            from manim import tempconfig
+            
+            # Annotation series are computed once, outside the scene
+            window = min(20, len(prices) // 4)
+            normalized_ma = _centered_sma_norm(arr, window, float(price_min), float(price_range))
+            derivative = np.gradient(normalized_prices) if len(prices) > 1 else np.zeros_like(normalized_prices)
+            
+            # The scene class is shared across calls; only the config differs
+            scene_config = StockSceneConfig(
+                title=title,
+                normalized_prices=normalized_prices,
+                normalized_ma=normalized_ma,
+                derivative=derivative,
+                show_equation=show_equation,
+                show_derivative=show_derivative,
+            )
+            StockPriceScene = _stock_price_scene_class()
+            
+            with tempconfig({"media_dir": str(self.output_dir), "output_file": output_name}):
+                scene = StockPriceScene(scene_config)
+                scene.render()
+                output_path = Path(scene.renderer.file_writer.movie_file_path)
         
-        metadata_path = self.output_dir / f"{output_name}_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        # Save metadata for rendering
+        self._write_metadata_template(
+            output_name,
+            _STOCK_METADATA_TEMPLATE,
+            data_points=len(prices),
+            price_min=float(price_min),
+            price_max=float(price_max),
+            show_equation=bool(show_equation),
+            show_derivative=bool(show_derivative),
+        )
         
         return output_path
     
@@ -244,17 +485,26 @@ class ManimGenerator:
         # This would create an animated correlation matrix
         # showing how correlations evolve or highlighting relationships
         
+        # Correlations lie in [-1, 1], so int8 scaled by 127 is enough for colour
+        # mapping at an eighth of the float64 size; undefined entries become 0
+        corr = np.nan_to_num(correlation_matrix.to_numpy(dtype=np.float64), nan=0.0)
+        quantized = np.rint(np.clip(corr, -1.0, 1.0) * CORRELATION_SCALE).astype(np.int8)
+        
+        matrix_path = self.output_dir / f"{output_name}_matrix.npy"
+        np.save(matrix_path, quantized)
+        
         output_path = self.output_dir / f"{output_name}.mp4"
         
         metadata = {
             "type": "manim_correlation_animation",
             "output_name": output_name,
             "matrix_size": len(correlation_matrix),
+            "labels": [str(c) for c in correlation_matrix.columns],
+            "scale": CORRELATION_SCALE,
+            "matrix_path": str(matrix_path),
         }
         
-        metadata_path = self.output_dir / f"{output_name}_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        self._write_metadata(output_name, metadata)
         
         return output_path
     
@@ -280,18 +530,32 @@ class ManimGenerator:
         
         # This would show frequency domain analysis of stock prices
         # demonstrating mathematical signal processing concepts
+        try:
+            from scipy.fft import rfft
+        except ImportError:
+            from numpy.fft import rfft
+        
+        # Real-input FFT on a contiguous float32 signal; an empty or all-NaN
+        # series has no spectrum
+        signal = np.ascontiguousarray(price_data.dropna().to_numpy(), dtype=np.float32)
+        if signal.size:
+            spectrum = rfft(signal).astype(np.complex64)
+        else:
+            spectrum = np.empty(0, dtype=np.complex64)
+        
+        # Binary .npy is far smaller and faster than embedding the spectrum in JSON
+        spectrum_path = self.output_dir / f"{output_name}_spectrum.npy"
+        np.save(spectrum_path, spectrum)
         
         output_path = self.output_dir / f"{output_name}.mp4"
         
-        metadata = {
-            "type": "manim_fourier_animation",
-            "output_name": output_name,
-            "data_points": len(price_data),
-        }
-        
-        metadata_path = self.output_dir / f"{output_name}_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        self._write_metadata_template(
+            output_name,
+            _FOURIER_METADATA_TEMPLATE,
+            data_points=len(price_data),
+            num_frequencies=len(spectrum),
+            spectrum_path=str(spectrum_path),
+        )
         
         return output_path
 
@@ -301,27 +565,28 @@ class ManimGenerator:
         correlation_data: pd.DataFrame,
         title: str = "House Price Feature Correlations",
         output_name: str = "housing_correlation_animation",
+        top_n: int = 20,
     ) -> Path:
         """Create an animated correlation matrix for housing features."""
         if not MANIM_AVAILABLE:
             raise ImportError("Manim is not installed")
         
-        corr_sorted = correlation_data.sort_values('Abs_Correlation', ascending=True)
+        # Strongest top_n features, weakest first for bottom-up drawing
+        top = _top_k_indices(correlation_data['Abs_Correlation'].to_numpy(), top_n)[::-1]
+        corr_sorted = correlation_data.iloc[top]
         features = corr_sorted['Feature'].tolist()
-        correlations = corr_sorted['Correlation'].tolist()
+        correlations = corr_sorted['Correlation'].to_numpy(dtype=np.float64)
         
         output_path = self.output_dir / f"{output_name}.mp4"
         metadata = {
             "type": "manim_housing_correlation",
             "output_name": output_name,
             "features": features,
-            "correlations": [float(c) for c in correlations],
+            "correlations": correlations,
             "num_features": len(features),
         }
         
-        metadata_path = self.output_dir / f"{output_name}_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        self._write_metadata(output_name, metadata)
         
         return output_path
     
@@ -338,18 +603,16 @@ class ManimGenerator:
             raise ImportError("Manim is not installed")
         
         output_path = self.output_dir / f"{output_name}.mp4"
-        metadata = {
-            "type": "manim_price_evolution",
-            "output_name": output_name,
-            "year_col": year_col,
-            "price_col": price_col,
-            "data_points": len(year_data),
-            "year_range": [int(year_data[year_col].min()), int(year_data[year_col].max())],
-        }
-        
-        metadata_path = self.output_dir / f"{output_name}_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        years = year_data[year_col].to_numpy()
+        self._write_metadata_template(
+            output_name,
+            _PRICE_EVOLUTION_METADATA_TEMPLATE,
+            year_col=year_col,
+            price_col=price_col,
+            data_points=len(year_data),
+            year_min=int(years.min()),
+            year_max=int(years.max()),
+        )
         
         return output_path
     
@@ -365,17 +628,17 @@ class ManimGenerator:
         if not MANIM_AVAILABLE:
             raise ImportError("Manim is not installed")
         
+        top = _top_k_indices(importance_data[importance_col].to_numpy(), 10)
+        
         output_path = self.output_dir / f"{output_name}.mp4"
         metadata = {
             "type": "manim_feature_importance",
             "output_name": output_name,
             "num_features": len(importance_data),
-            "top_features": importance_data.head(10)[feature_col].tolist(),
+            "top_features": importance_data[feature_col].iloc[top].tolist(),
         }
         
-        metadata_path = self.output_dir / f"{output_name}_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        self._write_metadata(output_name, metadata)
         
         return output_path
     
@@ -391,16 +654,16 @@ class ManimGenerator:
         if not MANIM_AVAILABLE:
             raise ImportError("Manim is not installed")
         
+        top = _top_k_indices(neighborhood_data[price_col].to_numpy(), 10)
+        
         output_path = self.output_dir / f"{output_name}.mp4"
         metadata = {
             "type": "manim_neighborhood_comparison",
             "output_name": output_name,
             "num_neighborhoods": len(neighborhood_data),
-            "top_neighborhoods": neighborhood_data.head(10)[neighborhood_col].tolist(),
+            "top_neighborhoods": neighborhood_data[neighborhood_col].iloc[top].tolist(),
         }
         
-        metadata_path = self.output_dir / f"{output_name}_metadata.json"
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
+        self._write_metadata(output_name, metadata)
         
         return output_path
@@ -6,27 +6,96 @@ Generates static publication-quality charts using matplotlib.
 
 import matplotlib.pyplot as plt
 import matplotlib.style as style
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import numpy as np
 import pandas as pd
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
 
+# Heatmaps with more cells than this are not annotated by default
+MAX_ANNOTATED_CELLS = 400
+
+# Scatter plots with at least this many points are rasterized in PDF/SVG output
+RASTERIZE_MIN_POINTS = 5000
+
+
+def _pooled_subplots(pool: Dict[tuple, plt.Figure], figsize: tuple) -> Tuple[plt.Figure, plt.Axes]:
+    """
+    Single-axes figure of the given size, reused from pool when possible.
+    
+    A reused figure keeps its canvas; its axes are cleared, or the whole
+    figure is when an earlier plot added extra axes such as a colorbar.
+    """
+    key = tuple(figsize)
+    fig = pool.get(key)
+    if fig is None:
+        fig, ax = plt.subplots(figsize=figsize)
+        pool[key] = fig
+        return fig, ax
+    
+    if len(fig.axes) == 1:
+        ax = fig.axes[0]
+        ax.clear()
+    else:
+        fig.clear()
+        ax = fig.add_subplot()
+    
+    return fig, ax
+
+
+def _triangle_mask(values: np.ndarray, triangle: Optional[bool] = None) -> Optional[np.ndarray]:
+    """
+    Mask hiding the cells above the diagonal of a square matrix.
+    
+    Args:
+        values: 2D matrix to be drawn
+        triangle: Force (True) or skip (False) masking; by default the mask
+            is only built when the matrix is symmetric
+    
+    Returns:
+        Boolean array that is True for hidden cells, or None to draw all cells
+    """
+    rows, cols = values.shape
+    if triangle is False or rows != cols:
+        return None
+    if triangle is None:
+        try:
+            symmetric = np.allclose(values, values.T, equal_nan=True)
+        except TypeError:
+            symmetric = False
+        if not symmetric:
+            return None
+    return np.triu(np.ones_like(values, dtype=bool), k=1)
+
+
 class MatplotlibGenerator:
     """Generator for matplotlib visualizations."""
     
-    def __init__(self, style_name: str = "seaborn-v0_8"):
+    def __init__(self, style_name: str = "seaborn-v0_8", reuse_figures: bool = False):
         """
         Initialize matplotlib generator.
         
         Args:
             style_name: Matplotlib style to use
+            reuse_figures: Draw into one pooled figure per figsize instead of
+                allocating a new one per call. A returned figure is then only
+                valid until the next plot of the same size, so save it first.
         """
         try:
             plt.style.use(style_name)
         except:
             plt.style.use('default')
         self.style_name = style_name
+        self.reuse_figures = reuse_figures
+        self._fig_pool: Dict[tuple, plt.Figure] = {}
+    
+    def _subplots(self, figsize: tuple) -> Tuple[plt.Figure, plt.Axes]:
+        """Get a figure and axes, from the pool when reuse_figures is set."""
+        if self.reuse_figures:
+            return _pooled_subplots(self._fig_pool, figsize)
+        return plt.subplots(figsize=figsize)
     
     def line_plot(
         self,
@@ -50,15 +119,36 @@ class MatplotlibGenerator:
             xlabel: X-axis label
             ylabel: Y-axis label
             figsize: Figure size
-            **kwargs: Additional arguments for plot
+            **kwargs: Additional arguments for plot (these draw one Line2D
+                per series instead of a single LineCollection)
             
         Returns:
             Matplotlib figure
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = self._subplots(figsize)
+        
+        x_arr = data[x_col].to_numpy()
         
-        for y_col in y_cols:
-            ax.plot(data[x_col], data[y_col], label=y_col, **kwargs)
+        if kwargs:
+            for y_col in y_cols:
+                ax.plot(x_arr, data[y_col].to_numpy(), label=y_col, **kwargs)
+        else:
+            # One collection is a single artist for Agg to draw, however many series
+            ax.xaxis.update_units(x_arr)
+            x_num = np.asarray(ax.convert_xunits(x_arr), dtype=np.float64)
+            segments = [
+                np.column_stack((x_num, data[y_col].to_numpy(dtype=np.float64)))
+                for y_col in y_cols
+            ]
+            cycle = plt.rcParams['axes.prop_cycle'].by_key().get('color', ['C0'])
+            colors = [cycle[i % len(cycle)] for i in range(len(y_cols))]
+            
+            ax.add_collection(LineCollection(segments, colors=colors))
+            ax.autoscale_view()
+            
+            # Proxy artists stand in for the collection's lines in the legend
+            for y_col, color in zip(y_cols, colors):
+                ax.add_line(Line2D([], [], color=color, label=y_col))
         
         ax.set_title(title, fontsize=14, fontweight='bold')
         ax.set_xlabel(xlabel)
@@ -66,7 +156,7 @@ class MatplotlibGenerator:
         ax.legend()
         ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
     def scatter_plot(
@@ -96,26 +186,32 @@ class MatplotlibGenerator:
         Returns:
             Matplotlib figure
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = self._subplots(figsize)
         
         scatter_kwargs = kwargs.copy()
+        # Dense point clouds go into vector outputs as one bitmap; axes stay vector
+        scatter_kwargs.setdefault('rasterized', len(data) >= RASTERIZE_MIN_POINTS)
+        
+        x_arr = data[x_col].to_numpy()
+        y_arr = data[y_col].to_numpy()
+        sizes = data[size_col].to_numpy() if size_col else 50
         
         if color_col:
             scatter = ax.scatter(
-                data[x_col],
-                data[y_col],
-                c=data[color_col],
-                s=data[size_col] if size_col else 50,
+                x_arr,
+                y_arr,
+                c=data[color_col].to_numpy(),
+                s=sizes,
                 cmap='viridis',
                 alpha=0.6,
                 **scatter_kwargs
             )
-            plt.colorbar(scatter, ax=ax, label=color_col)
+            fig.colorbar(scatter, ax=ax, label=color_col)
         else:
             ax.scatter(
-                data[x_col],
-                data[y_col],
-                s=data[size_col] if size_col else 50,
+                x_arr,
+                y_arr,
+                s=sizes,
                 alpha=0.6,
                 **scatter_kwargs
             )
@@ -125,7 +221,7 @@ class MatplotlibGenerator:
         ax.set_ylabel(y_col)
         ax.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
     def bar_plot(
@@ -151,17 +247,17 @@ class MatplotlibGenerator:
         Returns:
             Matplotlib figure
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = self._subplots(figsize)
         
-        ax.bar(data[x_col], data[y_col], **kwargs)
+        ax.bar(data[x_col].to_numpy(), data[y_col].to_numpy(), **kwargs)
         
         ax.set_title(title, fontsize=14, fontweight='bold')
         ax.set_xlabel(x_col)
         ax.set_ylabel(y_col)
         ax.grid(True, alpha=0.3, axis='y')
         
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        fig.tight_layout()
         return fig
     
     def heatmap(
@@ -170,6 +266,8 @@ class MatplotlibGenerator:
         title: str = "",
         figsize: tuple = (10, 8),
         cmap: str = "viridis",
+        annotate: Optional[bool] = None,
+        triangle: Optional[bool] = None,
         **kwargs
     ) -> plt.Figure:
         """
@@ -180,14 +278,23 @@ class MatplotlibGenerator:
             title: Plot title
             figsize: Figure size
             cmap: Colormap
+            annotate: Write each cell's value; by default only when the matrix
+                has at most MAX_ANNOTATED_CELLS cells
+            triangle: Draw only the diagonal and lower triangle; by default
+                when the matrix is symmetric, such as a correlation matrix
             **kwargs: Additional arguments for imshow
             
         Returns:
             Matplotlib figure
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = self._subplots(figsize)
         
-        im = ax.imshow(data.values, cmap=cmap, aspect='auto', **kwargs)
+        values = data.to_numpy()
+        mask = _triangle_mask(values, triangle)
+        if mask is None:
+            im = ax.imshow(values, cmap=cmap, aspect='auto', **kwargs)
+        else:
+            im = ax.imshow(np.ma.masked_array(values, mask=mask), cmap=cmap, aspect='auto', **kwargs)
         
         # Set ticks
         ax.set_xticks(np.arange(len(data.columns)))
@@ -196,18 +303,24 @@ class MatplotlibGenerator:
         ax.set_yticklabels(data.index)
         
         # Add colorbar
-        plt.colorbar(im, ax=ax)
+        fig.colorbar(im, ax=ax)
         
-        # Add text annotations
-        for i in range(len(data.index)):
-            for j in range(len(data.columns)):
-                text = ax.text(
-                    j, i, f'{data.iloc[i, j]:.2f}',
+        # Add text annotations, formatted in one vectorized pass
+        if annotate is None:
+            annotate = values.size <= MAX_ANNOTATED_CELLS
+        if annotate:
+            labels = np.char.mod('%.2f', values)
+            for (i, j), label in np.ndenumerate(labels):
+                # Mirrored cells of a symmetric matrix are hidden
+                if mask is not None and j > i:
+                    continue
+                ax.text(
+                    j, i, label,
                     ha="center", va="center", color="white", fontsize=8
                 )
         
         ax.set_title(title, fontsize=14, fontweight='bold')
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
     def histogram(
@@ -231,15 +344,15 @@ class MatplotlibGenerator:
         Returns:
             Matplotlib figure
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = self._subplots(figsize)
         
-        ax.hist(data, bins=bins, edgecolor='black', alpha=0.7, **kwargs)
+        ax.hist(data.to_numpy(), bins=bins, edgecolor='black', alpha=0.7, **kwargs)
         
         ax.set_title(title, fontsize=14, fontweight='bold')
         ax.set_xlabel(data.name or 'Value')
         ax.set_ylabel('Frequency')
         ax.grid(True, alpha=0.3, axis='y')
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
 
@@ -4,19 +4,178 @@ Network Generator
 Generates network/graph visualizations using networkx and plotly.
 """
 
+import random
+from collections import OrderedDict
 import networkx as nx
-import plotly.graph_objects as go
 import pandas as pd
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
 import numpy as np
 
+# plotly is imported by plotly_network, the only method that draws
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Number of node layouts kept per generator
+LAYOUT_CACHE_SIZE = 32
+
+# Spring layouts of graphs larger than this use the numba kernel when available
+NUMBA_LAYOUT_MIN_NODES = 500
+
+# Nodes sampled to estimate average clustering on larger graphs
+CLUSTERING_SAMPLE_SIZE = 500
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _fr_layout_kernel(pos, indptr, indices, weights, iterations, k):
+        """
+        Fruchterman-Reingold iterations over a CSR adjacency, updating pos in place.
+        
+        Forces follow networkx's spring_layout; repulsion is cut off beyond 2k
+        and evaluated on squared distances, so it needs no square root.
+        """
+        n = pos.shape[0]
+        k2 = k * k
+        cutoff2 = 4.0 * k2
+        inv_k = 1.0 / k
+        disp = np.zeros((n, 2), dtype=np.float64)
+        
+        t = 0.1 * max(pos[:, 0].max() - pos[:, 0].min(), pos[:, 1].max() - pos[:, 1].min())
+        dt = t / (iterations + 1)
+        
+        for _ in range(iterations):
+            for i in prange(n):
+                xi = pos[i, 0]
+                yi = pos[i, 1]
+                fx = 0.0
+                fy = 0.0
+                
+                # Repulsion between all pairs within the cutoff
+                for j in range(n):
+                    dx = xi - pos[j, 0]
+                    dy = yi - pos[j, 1]
+                    d2 = dx * dx + dy * dy
+                    if j != i and d2 < cutoff2:
+                        f = k2 / max(d2, 1e-4)
+                        fx += dx * f
+                        fy += dy * f
+                
+                # Attraction along edges
+                for p in range(indptr[i], indptr[i + 1]):
+                    j = indices[p]
+                    dx = xi - pos[j, 0]
+                    dy = yi - pos[j, 1]
+                    f = weights[p] * max(np.sqrt(dx * dx + dy * dy), 0.01) * inv_k
+                    fx -= dx * f
+                    fy -= dy * f
+                
+                disp[i, 0] = fx
+                disp[i, 1] = fy
+            
+            for i in prange(n):
+                step = t / max(np.sqrt(disp[i, 0] ** 2 + disp[i, 1] ** 2), 0.01)
+                pos[i, 0] += disp[i, 0] * step
+                pos[i, 1] += disp[i, 1] * step
+            t -= dt
+        
+        return pos
+
+
+def _fr_layout_numba(G: nx.Graph, iterations: int = 50, k: float = 1.0) -> Dict[Any, np.ndarray]:
+    """
+    Spring layout computed by the numba kernel, scaled like nx.spring_layout.
+    
+    Args:
+        G: NetworkX graph
+        iterations: Number of force-simulation steps
+        k: Optimal distance between nodes
+        
+    Returns:
+        Dictionary mapping nodes to (x, y) positions
+    """
+    nodes = list(G.nodes())
+    n = len(nodes)
+    m = G.number_of_edges()
+    node_index = {node: i for i, node in enumerate(nodes)}
+    
+    # Symmetric CSR adjacency with edge weights (default 1, as networkx)
+    ends = np.fromiter(
+        (node_index[node] for edge in G.edges() for node in edge),
+        dtype=np.intp,
+        count=2 * m,
+    ).reshape(-1, 2)
+    edge_weights = np.fromiter(
+        (w for _, _, w in G.edges(data='weight', default=1.0)),
+        dtype=np.float64,
+        count=m,
+    )
+    rows = np.concatenate((ends[:, 0], ends[:, 1]))
+    order = np.argsort(rows, kind='stable')
+    indices = np.concatenate((ends[:, 1], ends[:, 0]))[order]
+    weights = np.concatenate((edge_weights, edge_weights))[order]
+    indptr = np.zeros(n + 1, dtype=np.intp)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    
+    pos = np.random.default_rng().random((n, 2), dtype=np.float32)
+    pos = _fr_layout_kernel(pos, indptr, indices, weights, iterations, float(k))
+    
+    # Center on the origin with the largest coordinate at 1
+    pos -= pos.mean(axis=0)
+    limit = np.abs(pos).max()
+    if limit > 0:
+        pos /= limit
+    
+    return dict(zip(nodes, pos))
+
+
+def _compute_layout(G: nx.Graph, layout: str) -> Dict[Any, np.ndarray]:
+    """Run the named networkx layout algorithm."""
+    if layout == "spring":
+        if NUMBA_AVAILABLE and len(G) > NUMBA_LAYOUT_MIN_NODES:
+            return _fr_layout_numba(G, iterations=50, k=1.0)
+        return nx.spring_layout(G, k=1, iterations=50)
+    elif layout == "circular":
+        return nx.circular_layout(G)
+    elif layout == "kamada_kawai":
+        return nx.kamada_kawai_layout(G)
+    else:
+        return nx.spring_layout(G)
+
 
 class NetworkGenerator:
     """Generator for network/graph visualizations."""
     
     def __init__(self):
         """Initialize network generator."""
-        pass
+        self._layout_cache: OrderedDict = OrderedDict()
+    
+    def _get_layout(self, G: nx.Graph, layout: str) -> Dict[Any, np.ndarray]:
+        """
+        Get node positions for a graph, reusing a layout computed earlier.
+        
+        Layouts are keyed on the node labels, the edges and their weights, so
+        redrawing an unchanged graph skips the force simulation.
+        """
+        key = (layout, tuple(G.nodes()), tuple(G.edges(data='weight')))
+        cached = self._layout_cache.get(key)
+        if cached is not None:
+            self._layout_cache.move_to_end(key)
+            return cached
+        
+        pos = _compute_layout(G, layout)
+        
+        self._layout_cache[key] = pos
+        if len(self._layout_cache) > LAYOUT_CACHE_SIZE:
+            self._layout_cache.popitem(last=False)
+        
+        return pos
     
     def create_network_from_edges(
         self,
@@ -37,21 +196,20 @@ class NetworkGenerator:
         Returns:
             NetworkX graph
         """
+        # Weights are always stored under the 'weight' edge attribute
         if weight_col:
-            edges = [
-                (row[source_col], row[target_col], {'weight': row[weight_col]})
-                for _, row in edges_df.iterrows()
-            ]
-            G = nx.Graph()
-            G.add_edges_from(edges)
-        else:
-            G = nx.from_pandas_edgelist(
-                edges_df,
-                source=source_col,
-                target=target_col,
-                create_using=nx.Graph
+            edges_df = edges_df[[source_col, target_col]].assign(
+                weight=edges_df[weight_col].to_numpy()
             )
         
+        G = nx.from_pandas_edgelist(
+            edges_df,
+            source=source_col,
+            target=target_col,
+            edge_attr='weight' if weight_col else None,
+            create_using=nx.Graph
+        )
+        
         return G
     
     def plotly_network(
@@ -63,7 +221,7 @@ class NetworkGenerator:
         node_color_col: Optional[str] = None,
         edge_weight_col: Optional[str] = None,
         **kwargs
-    ) -> go.Figure:
+    ) -> "go.Figure":
         """
         Create an interactive network visualization with Plotly.
         
@@ -79,58 +237,53 @@ class NetworkGenerator:
         Returns:
             Plotly figure
         """
+        import plotly.graph_objects as go
+        
         # Calculate layout
-        if layout == "spring":
-            pos = nx.spring_layout(G, k=1, iterations=50)
-        elif layout == "circular":
-            pos = nx.circular_layout(G)
-        elif layout == "kamada_kawai":
-            pos = nx.kamada_kawai_layout(G)
-        else:
-            pos = nx.spring_layout(G)
+        pos = self._get_layout(G, layout)
         
         # Extract node positions
-        node_x = [pos[node][0] for node in G.nodes()]
-        node_y = [pos[node][1] for node in G.nodes()]
-        
-        # Create edge traces
-        edge_traces = []
-        for edge in G.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_trace = go.Scatter(
-                x=[x0, x1, None],
-                y=[y0, y1, None],
-                mode='lines',
-                line=dict(width=0.5, color='#888'),
-                hoverinfo='none',
-                showlegend=False,
-            )
-            edge_traces.append(edge_trace)
-        
-        # Create node trace
-        node_info = []
-        node_sizes = []
-        node_colors = []
-        
-        for node in G.nodes():
-            node_info.append(f"Node: {node}<br>")
-            if node_size_col and node_size_col in G.nodes[node]:
-                node_sizes.append(G.nodes[node][node_size_col] * 10)
-            else:
-                node_sizes.append(10)
-            
-            if node_color_col and node_color_col in G.nodes[node]:
-                node_colors.append(G.nodes[node][node_color_col])
-            else:
-                node_colors.append(1)
+        node_index = {node: i for i, node in enumerate(G.nodes())}
+        xy = np.array([pos[node] for node in G.nodes()], dtype=np.float64).reshape(-1, 2)
+        node_x = xy[:, 0]
+        node_y = xy[:, 1]
+        
+        # All edges in one SVG trace: x0, x1, NaN per edge, the NaN breaking the
+        # line. Scattergl would draw on a canvas above the nodes and labels
+        ends = np.fromiter(
+            (node_index[node] for edge in G.edges() for node in edge),
+            dtype=np.intp,
+            count=2 * G.number_of_edges(),
+        ).reshape(-1, 2)
+        gaps = np.full(len(ends), np.nan)
+        edge_trace = go.Scatter(
+            x=np.column_stack((node_x[ends[:, 0]], node_x[ends[:, 1]], gaps)).ravel(),
+            y=np.column_stack((node_y[ends[:, 0]], node_y[ends[:, 1]], gaps)).ravel(),
+            mode='lines',
+            line=dict(width=0.5, color='#888'),
+            hoverinfo='none',
+            showlegend=False,
+        )
+        
+        # Create node trace from one attribute scan per column
+        nodes = list(node_index)
+        size_attrs = nx.get_node_attributes(G, node_size_col) if node_size_col else {}
+        color_attrs = nx.get_node_attributes(G, node_color_col) if node_color_col else {}
+        
+        node_sizes = np.fromiter(
+            (size_attrs.get(node, 1) * 10 for node in nodes),
+            dtype=np.float32,
+            count=len(nodes),
+        )
+        # Colors may be numbers or CSS names, so they stay a plain list
+        node_colors = [color_attrs.get(node, 1) for node in nodes]
         
         node_trace = go.Scatter(
             x=node_x,
             y=node_y,
             mode='markers+text',
             hoverinfo='text',
-            text=[node for node in G.nodes()],
+            text=nodes,
             textposition="middle center",
             marker=dict(
                 size=node_sizes,
@@ -143,7 +296,7 @@ class NetworkGenerator:
         
         # Create figure
         fig = go.Figure(
-            data=edge_traces + [node_trace],
+            data=[edge_trace, node_trace],
             layout=go.Layout(
                 title=title,
                 showlegend=False,
@@ -166,21 +319,40 @@ class NetworkGenerator:
         
         return fig
     
-    def network_metrics(self, G: nx.Graph) -> Dict[str, Any]:
+    def network_metrics(
+        self,
+        G: nx.Graph,
+        include_clustering: bool = True,
+        include_connectivity: bool = True,
+        clustering_sample: Optional[int] = CLUSTERING_SAMPLE_SIZE,
+    ) -> Dict[str, Any]:
         """
         Calculate network metrics.
         
         Args:
             G: NetworkX graph
+            include_clustering: Compute 'avg_clustering'
+            include_connectivity: Compute 'is_connected'
+            clustering_sample: Estimate clustering from this many randomly
+                chosen nodes on larger graphs (None uses every node)
             
         Returns:
             Dictionary with network metrics
         """
-        return {
+        metrics = {
             'num_nodes': G.number_of_nodes(),
             'num_edges': G.number_of_edges(),
             'density': nx.density(G),
-            'avg_clustering': nx.average_clustering(G),
-            'is_connected': nx.is_connected(G),
         }
+        
+        if include_clustering:
+            nodes = None
+            if clustering_sample is not None and len(G) > clustering_sample:
+                nodes = random.Random(0).sample(list(G), clustering_sample)
+            metrics['avg_clustering'] = nx.average_clustering(G, nodes=nodes)
+        
+        if include_connectivity:
+            metrics['is_connected'] = nx.is_connected(G)
+        
+        return metrics
 
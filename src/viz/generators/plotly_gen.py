@@ -5,15 +5,81 @@ Generates interactive web visualizations using Plotly.
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
+import plotly.io as pio
 import pandas as pd
 from typing import Optional, Dict, Any, List
 import numpy as np
 
+# plotly.express is imported inside the methods that use it
+
+
+# Row count from which scatter/line traces are drawn with WebGL instead of SVG
+MIN_SCATTERGL_ROWS = 1000
+
+# Points kept per line/candlestick trace, roughly one per horizontal pixel
+MAX_LINE_POINTS = 2000
+
+# Heatmaps with more cells than this are drawn without per-cell text
+MAX_ANNOTATED_CELLS = 400
+
+
+def _downsample(x: np.ndarray, y: np.ndarray, n_out: int = MAX_LINE_POINTS) -> np.ndarray:
+    """
+    Indices of at most n_out points that preserve the shape of a series.
+    
+    Largest-Triangle-Three-Buckets with each bucket's fixed vertex taken from
+    the previous bucket's centroid rather than the previously chosen point,
+    which lets every bucket be resolved in one vectorized pass. The first and
+    last points are always kept; non-numeric x is treated as evenly spaced.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x)
+    if x.dtype.kind == 'M':
+        x = x.view('i8').astype(np.float64)
+    elif x.dtype.kind in 'iuf':
+        x = x.astype(np.float64)
+    else:
+        x = np.arange(n, dtype=np.float64)
+    
+    # n_out - 2 contiguous buckets over the interior points 1..n-2
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    starts = edges[:-1]
+    sizes = np.diff(edges)
+    cx = np.add.reduceat(x[:-1], starts) / sizes
+    cy = np.add.reduceat(y[:-1], starts) / sizes
+    
+    # Fixed vertices on either side of each bucket
+    ax = np.concatenate(([x[0]], cx[:-1]))
+    ay = np.concatenate(([y[0]], cy[:-1]))
+    bx = np.concatenate((cx[1:], [x[-1]]))
+    by = np.concatenate((cy[1:], [y[-1]]))
+    
+    bucket = np.repeat(np.arange(len(sizes)), sizes)
+    px, py = x[1:-1], y[1:-1]
+    area = np.abs(
+        (ax[bucket] - bx[bucket]) * (py - ay[bucket])
+        - (ax[bucket] - px) * (by[bucket] - ay[bucket])
+    )
+    area = np.where(np.isnan(area), -1.0, area)
+    
+    # First point reaching its bucket's maximum area
+    best = np.maximum.reduceat(area, starts - 1)
+    hits = np.flatnonzero(area == best[bucket])
+    _, first = np.unique(bucket[hits], return_index=True)
+    
+    return np.concatenate(([0], hits[first] + 1, [n - 1]))
+
 
 class PlotlyGenerator:
     """Generator for Plotly interactive visualizations."""
     
+    # Per-class or per-instance override of MIN_SCATTERGL_ROWS
+    min_scattergl_rows = MIN_SCATTERGL_ROWS
+    
     def __init__(self, template: str = "plotly_white"):
         """
         Initialize Plotly generator.
@@ -22,6 +88,8 @@ class PlotlyGenerator:
             template: Plotly template name
         """
         self.template = template
+        # Resolve the named template once instead of on every figure
+        self._template_obj = pio.templates[template]
     
     def line_chart(
         self,
@@ -31,6 +99,7 @@ class PlotlyGenerator:
         title: str = "",
         xlabel: str = "",
         ylabel: str = "",
+        max_points: Optional[int] = MAX_LINE_POINTS,
         **kwargs
     ) -> go.Figure:
         """
@@ -43,17 +112,30 @@ class PlotlyGenerator:
             title: Chart title
             xlabel: X-axis label
             ylabel: Y-axis label
+            max_points: Downsample each series to this many points with LTTB
+                (None keeps every row)
             **kwargs: Additional arguments
             
         Returns:
             Plotly figure
         """
+        # WebGL avoids one SVG path node per point on long series
+        trace_cls = go.Scattergl if len(data) >= self.min_scattergl_rows else go.Scatter
+        
+        downsample = max_points is not None and len(data) > max_points
+        x_values = data[x_col].to_numpy()
+        
         fig = go.Figure()
         
         for y_col in y_cols:
-            fig.add_trace(go.Scatter(
-                x=data[x_col],
-                y=data[y_col],
+            x, y = x_values, data[y_col].to_numpy()
+            if downsample:
+                keep = _downsample(x, y, max_points)
+                x, y = x[keep], y[keep]
+            
+            fig.add_trace(trace_cls(
+                x=x,
+                y=y,
                 mode='lines',
                 name=y_col,
                 hovertemplate=f'<b>{y_col}</b><br>' +
@@ -65,7 +147,7 @@ class PlotlyGenerator:
             title=title,
             xaxis_title=xlabel,
             yaxis_title=ylabel,
-            template=self.template,
+            template=self._template_obj,
             hovermode='x unified',
             **kwargs
         )
@@ -97,6 +179,11 @@ class PlotlyGenerator:
         Returns:
             Plotly figure
         """
+        import plotly.express as px
+        
+        if len(data) >= self.min_scattergl_rows:
+            kwargs.setdefault('render_mode', 'webgl')
+        
         fig = px.scatter(
             data,
             x=x_col,
@@ -104,7 +191,7 @@ class PlotlyGenerator:
             color=color_col,
             size=size_col,
             title=title,
-            template=self.template,
+            template=self._template_obj,
             **kwargs
         )
         
@@ -133,12 +220,14 @@ class PlotlyGenerator:
         Returns:
             Plotly figure
         """
+        import plotly.express as px
+        
         fig = px.bar(
             data,
             x=x_col,
             y=y_col,
             title=title,
-            template=self.template,
+            template=self._template_obj,
             orientation=orientation,
             **kwargs
         )
@@ -150,6 +239,7 @@ class PlotlyGenerator:
         data: pd.DataFrame,
         title: str = "",
         colorscale: str = "Viridis",
+        annotate: Optional[bool] = None,
         **kwargs
     ) -> go.Figure:
         """
@@ -159,25 +249,36 @@ class PlotlyGenerator:
             data: DataFrame (correlation matrix or similar)
             title: Chart title
             colorscale: Color scale name
+            annotate: Write each cell's value; by default only when the matrix
+                has at most MAX_ANNOTATED_CELLS cells
             **kwargs: Additional arguments
             
         Returns:
             Plotly figure
         """
-        fig = go.Figure(data=go.Heatmap(
-            z=data.values,
-            x=data.columns,
-            y=data.index,
-            colorscale=colorscale,
-            text=data.values,
+        values = data.to_numpy()
+        
+        # Each text label is a separate SVG node in the browser
+        if annotate is None:
+            annotate = values.size <= MAX_ANNOTATED_CELLS
+        text_args = dict(
+            text=values,
             texttemplate='%{text:.2f}',
             textfont={"size": 10},
+        ) if annotate else {}
+        
+        fig = go.Figure(data=go.Heatmap(
+            z=values,
+            x=data.columns.to_numpy(),
+            y=data.index.to_numpy(),
+            colorscale=colorscale,
+            **text_args,
             **kwargs
         ))
         
         fig.update_layout(
             title=title,
-            template=self.template,
+            template=self._template_obj,
             xaxis_title="",
             yaxis_title="",
         )
@@ -188,6 +289,7 @@ class PlotlyGenerator:
         self,
         data: pd.DataFrame,
         title: str = "Candlestick Chart",
+        max_points: Optional[int] = MAX_LINE_POINTS,
         **kwargs
     ) -> go.Figure:
         """
@@ -196,28 +298,65 @@ class PlotlyGenerator:
         Args:
             data: DataFrame with OHLC columns
             title: Chart title
+            max_points: Resample dated data into at most about this many
+                OHLC bars (None keeps every row)
             **kwargs: Additional arguments
             
         Returns:
             Plotly figure
         """
+        if max_points is not None and len(data) > max_points:
+            data = self._resample_ohlc(data, max_points)
+        
+        x = data.index if isinstance(data.index, pd.DatetimeIndex) else data.get('Date', data.index)
+        
+        # Only the OHLC columns are sent; float32 halves their encoded size
+        ohlc = data[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=np.float32)
+        
         fig = go.Figure(data=go.Candlestick(
-            x=data.index if isinstance(data.index, pd.DatetimeIndex) else data.get('Date', data.index),
-            open=data['Open'],
-            high=data['High'],
-            low=data['Low'],
-            close=data['Close'],
+            x=np.asarray(x),
+            open=ohlc[:, 0],
+            high=ohlc[:, 1],
+            low=ohlc[:, 2],
+            close=ohlc[:, 3],
             **kwargs
         ))
         
         fig.update_layout(
             title=title,
-            template=self.template,
+            template=self._template_obj,
             xaxis_rangeslider_visible=False,
         )
         
         return fig
     
+    @staticmethod
+    def _resample_ohlc(data: pd.DataFrame, max_points: int) -> pd.DataFrame:
+        """
+        Aggregate OHLC rows into time bins so at most ~max_points bars remain.
+        
+        Data without a DatetimeIndex or Date column is returned unchanged.
+        """
+        if isinstance(data.index, pd.DatetimeIndex):
+            dated = data
+        elif 'Date' in data.columns:
+            dated = data.set_index(pd.DatetimeIndex(pd.to_datetime(data['Date'])))
+        else:
+            return data
+        
+        step = (dated.index.max() - dated.index.min()) / max_points
+        if not step > pd.Timedelta(0):
+            return data
+        
+        ohlc = dated.resample(step.ceil('min')).agg({
+            'Open': 'first',
+            'High': 'max',
+            'Low': 'min',
+            'Close': 'last',
+        })
+        # Bins with no trades (weekends, holidays) would draw as gaps of NaN
+        return ohlc.dropna(subset=['Open'])
+    
     def sunburst(
         self,
         data: pd.DataFrame,
@@ -239,12 +378,23 @@ class PlotlyGenerator:
         Returns:
             Plotly figure
         """
+        import plotly.express as px
+        
+        # px groups by every path level; integer-coded categories group faster
+        # than object strings and give the same hierarchy
+        text_cols = [
+            c for c in path_cols
+            if pd.api.types.is_object_dtype(data[c]) or pd.api.types.is_string_dtype(data[c])
+        ]
+        if text_cols:
+            data = data.assign(**{c: data[c].astype('category') for c in text_cols})
+        
         fig = px.sunburst(
             data,
             path=path_cols,
             values=values_col,
             title=title,
-            template=self.template,
+            template=self._template_obj,
             **kwargs
         )
         
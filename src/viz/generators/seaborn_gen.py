@@ -7,25 +7,66 @@ Generates statistical visualizations using seaborn.
 import seaborn as sns
 import matplotlib.pyplot as plt
 import pandas as pd
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 import numpy as np
 
+from .matplotlib_gen import _pooled_subplots, _triangle_mask
+
+
+# Rows drawn in each pair plot panel by default
+MAX_PAIR_PLOT_SAMPLES = 5000
+
+
+def _correlation_matrix(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Pearson correlation of the numeric columns as float32.
+    
+    Complete data goes through a single np.corrcoef (one BLAS product);
+    frames with missing values keep pandas' pairwise-complete handling.
+    """
+    numeric = data.select_dtypes(include=[np.number])
+    values = numeric.to_numpy(dtype=np.float32, na_value=np.nan)
+    
+    if np.isnan(values).any() or len(values) < 2:
+        return numeric.corr().astype(np.float32)
+    
+    # Constant columns give NaN rows, as with DataFrame.corr()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        corr = np.corrcoef(values, rowvar=False, dtype=np.float32)
+    
+    return pd.DataFrame(
+        np.atleast_2d(corr),
+        index=numeric.columns,
+        columns=numeric.columns,
+    )
+
 
 class SeabornGenerator:
     """Generator for seaborn visualizations."""
     
-    def __init__(self, style: str = "whitegrid", palette: str = "husl"):
+    def __init__(self, style: str = "whitegrid", palette: str = "husl", reuse_figures: bool = False):
         """
         Initialize seaborn generator.
         
         Args:
             style: Seaborn style
             palette: Color palette
+            reuse_figures: Draw into one pooled figure per figsize instead of
+                allocating a new one per call. A returned figure is then only
+                valid until the next plot of the same size, so save it first.
         """
         sns.set_style(style)
         sns.set_palette(palette)
         self.style = style
         self.palette = palette
+        self.reuse_figures = reuse_figures
+        self._fig_pool: Dict[tuple, plt.Figure] = {}
+    
+    def _subplots(self, figsize: tuple) -> Tuple[plt.Figure, plt.Axes]:
+        """Get a figure and axes, from the pool when reuse_figures is set."""
+        if self.reuse_figures:
+            return _pooled_subplots(self._fig_pool, figsize)
+        return plt.subplots(figsize=figsize)
     
     def correlation_heatmap(
         self,
@@ -33,6 +74,7 @@ class SeabornGenerator:
         title: str = "Correlation Heatmap",
         figsize: tuple = (10, 8),
         annot: bool = True,
+        triangle: Optional[bool] = None,
         **kwargs
     ) -> plt.Figure:
         """
@@ -43,15 +85,21 @@ class SeabornGenerator:
             title: Plot title
             figsize: Figure size
             annot: Whether to annotate with correlation values
+            triangle: Draw only the diagonal and lower triangle; by default
+                when the correlation matrix is symmetric
             **kwargs: Additional arguments for heatmap
             
         Returns:
             Matplotlib figure
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = self._subplots(figsize)
         
         # Calculate correlation
-        corr = data.select_dtypes(include=[np.number]).corr()
+        corr = _correlation_matrix(data)
+        
+        # Hide the mirrored upper triangle, halving the annotation artists
+        if 'mask' not in kwargs:
+            kwargs['mask'] = _triangle_mask(corr.to_numpy(), triangle)
         
         sns.heatmap(
             corr,
@@ -67,7 +115,7 @@ class SeabornGenerator:
         )
         
         ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
     def pair_plot(
@@ -75,6 +123,7 @@ class SeabornGenerator:
         data: pd.DataFrame,
         hue: Optional[str] = None,
         title: str = "Pair Plot",
+        max_samples: Optional[int] = MAX_PAIR_PLOT_SAMPLES,
         **kwargs
     ) -> plt.Figure:
         """
@@ -84,12 +133,23 @@ class SeabornGenerator:
             data: DataFrame with numeric columns
             hue: Optional column for color grouping
             title: Plot title
+            max_samples: Plot a uniform random sample of this many rows
+                (None plots every row)
             **kwargs: Additional arguments for pairplot
             
         Returns:
             Matplotlib figure
         """
-        fig = sns.pairplot(data, hue=hue, **kwargs)
+        # Every off-diagonal panel draws all rows, so cap them up front
+        if max_samples is not None and len(data) > max_samples:
+            data = data.sample(n=max_samples, random_state=0)
+        
+        # Scatter panels are embedded as bitmaps in PDF/SVG output
+        plot_kws = dict(kwargs.pop('plot_kws', None) or {})
+        if kwargs.get('kind', 'scatter') == 'scatter':
+            plot_kws.setdefault('rasterized', True)
+        
+        fig = sns.pairplot(data, hue=hue, plot_kws=plot_kws, **kwargs)
         fig.fig.suptitle(title, fontsize=14, fontweight='bold', y=1.02)
         return fig.fig
     
@@ -118,7 +178,7 @@ class SeabornGenerator:
         Returns:
             Matplotlib figure
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = self._subplots(figsize)
         
         sns.violinplot(
             data=data,
@@ -130,8 +190,8 @@ class SeabornGenerator:
         )
         
         ax.set_title(title, fontsize=14, fontweight='bold')
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        fig.tight_layout()
         return fig
     
     def box_plot(
@@ -159,7 +219,7 @@ class SeabornGenerator:
         Returns:
             Matplotlib figure
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = self._subplots(figsize)
         
         sns.boxplot(
             data=data,
@@ -171,8 +231,8 @@ class SeabornGenerator:
         )
         
         ax.set_title(title, fontsize=14, fontweight='bold')
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
+        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+        fig.tight_layout()
         return fig
     
     def distribution_plot(
@@ -194,13 +254,13 @@ class SeabornGenerator:
         Returns:
             Matplotlib figure
         """
-        fig, ax = plt.subplots(figsize=figsize)
+        fig, ax = self._subplots(figsize)
         
         sns.histplot(data, kde=True, ax=ax, **kwargs)
         
         ax.set_title(title, fontsize=14, fontweight='bold')
         ax.set_xlabel(data.name or 'Value')
         ax.set_ylabel('Density')
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
 